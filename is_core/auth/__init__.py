@@ -1,12 +1,14 @@
 from __future__ import unicode_literals
 
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.http.response import HttpResponseForbidden
 from django.template.loader import render_to_string
 from django.template.context import RequestContext
 from django.utils.functional import SimpleLazyObject
 
-from is_core.utils.models import get_object_or_none
+from is_core.utils.models import get_object_or_none, get_request_obj
+from is_core.instrumentation import phase, instrument_view
 from is_core import config
 
 
@@ -42,10 +44,22 @@ class Auth(object):
                 return True
         return False
 
+    def _get_validator_obj(self, request, validator):
+        model = validator.im_self.model
+        pk = request.kwargs['pk']
+        core = getattr(validator.im_self, 'core', None)
+        if getattr(core, 'model', None) is model:
+            # Object is loaded through the core queryset and shared with the view or resource
+            try:
+                return get_request_obj(request, core.get_queryset(request), pk)
+            except (ObjectDoesNotExist, ValidationError, ValueError):
+                pass
+        return get_obj(model, pk)
+
     def validator_kwargs(self, request, validator):
         if request.kwargs.has_key('pk'):
             if hasattr(validator.im_self, 'model'):
-                return {'obj': SimpleLazyObject(lambda: get_obj(validator.im_self.model, request.kwargs['pk']))}
+                return {'obj': SimpleLazyObject(lambda: self._get_validator_obj(request, validator))}
         return {}
 
 
@@ -62,12 +76,17 @@ class PermWrapper(Auth):
 
     def wrap(self, func):
 
-        def wrapper(request, *args, **kwargs):
-            if not self._check_permissions(request):
+        def checked_view(request, *args, **kwargs):
+            with phase(request, 'permissions'):
+                has_permissions = self._check_permissions(request)
+            if not has_permissions:
                 return self._forbidden(request)
 
             return self._wrap(func, request, *args, **kwargs)
 
+        def wrapper(request, *args, **kwargs):
+            return instrument_view(request, 'request', checked_view, *args, **kwargs)
+
         return wrapper
 
 
@@ -1,20 +1,103 @@
 from __future__ import unicode_literals
 
+from functools import wraps
+
+from django.utils.functional import LazyObject, empty
+
+
+def permission_cache_exempt(func):
+    """
+    Marks permission method whose result must not be cached during request (result is not pure).
+    """
+    func.permission_cache_exempt = True
+    return func
+
+
+def _get_permission_obj(args, kwargs):
+    """
+    Returns (True, obj) if permission method is called with standard arguments (request, obj=None).
+    """
+    if not args and not kwargs:
+        return True, None
+    elif len(args) == 1 and not kwargs:
+        return True, args[0]
+    elif not args and list(kwargs.keys()) == ['obj']:
+        return True, kwargs['obj']
+    return False, None
+
+
+def cached_permission(func):
+    """
+    Caches result of permission method during request, key is (core, method, obj pk). Calls with other arguments,
+    objects without pk and not loaded lazy objects are not cached.
+    """
+    if getattr(func, 'permission_cache_exempt', False) or getattr(func, 'is_cached_permission', False):
+        return func
+
+    @wraps(func)
+    def wrapper(self, request, *args, **kwargs):
+        is_standard_call, obj = _get_permission_obj(args, kwargs)
+        if (not is_standard_call or request is None or
+                (isinstance(obj, LazyObject) and obj._wrapped is empty) or
+                (obj is not None and getattr(obj, 'pk', None) is None)):
+            return func(self, request, *args, **kwargs)
+
+        if not hasattr(request, '_permission_cache'):
+            request._permission_cache = {}
+        key = (self, func, obj is not None and (obj.__class__, obj.pk) or None)
+        try:
+            return request._permission_cache[key]
+        except KeyError:
+            result = request._permission_cache[key] = func(self, request, *args, **kwargs)
+            return result
+
+    wrapper.is_cached_permission = True
+    return wrapper
+
+
+def clear_permission_cache(request):
+    """
+    Permissions can depend on the data, cache must be cleared after the objects are changed.
+    """
+    if hasattr(request, '_permission_cache'):
+        request._permission_cache = {}
+
+
+def is_permission_method_name(name):
+    return name.startswith('has_') and name.endswith('_permission')
+
+
+def get_permission_type(name):
+    """
+    Returns type of the permission method (read, create, update or delete), e.g. has_rest_read_permission -> read.
+    """
+    return name.rsplit('_', 2)[1]
+
+
+# Permission types that are checked by the HTTP methods
+http_method_permission_types = {
+    'GET': 'read', 'HEAD': 'read', 'POST': 'create', 'PUT': 'update', 'PATCH': 'update', 'DELETE': 'delete',
+}
+
 
 class PermissionsMixin(object):
     """
     Mixin that validate user permissions inside ISCore
     """
 
+    @cached_permission
     def has_read_permission(self, request, obj=None):
         return True
 
+    @cached_permission
     def has_create_permission(self, request, obj=None):
         return True
 
+    @cached_permission
     def has_update_permission(self, request, obj=None):
         return True
 
+    @cached_permission
     def has_delete_permission(self, request, obj=None):
         return True
 
@@ -24,15 +107,19 @@ class PermissionsUIMixin(PermissionsMixin):
     Mixin that validate UI user permissions inside ISCore
     """
 
+    @cached_permission
     def has_ui_read_permission(self, request, obj=None):
         return self.has_read_permission(request, obj)
 
+    @cached_permission
     def has_ui_create_permission(self, request, obj=None):
         return self.has_create_permission(request, obj)
 
+    @cached_permission
     def has_ui_update_permission(self, request, obj=None):
         return self.has_update_permission(request, obj)
 
+    @cached_permission
     def has_ui_delete_permission(self, request, obj=None):
         return self.has_delete_permission(request, obj)
 
@@ -42,14 +129,23 @@ class PermissionsRestMixin(PermissionsMixin):
     Mixin that validate REST user permissions inside ISCore
     """
 
+    @cached_permission
     def has_rest_read_permission(self, request, obj=None):
         return self.has_read_permission(request, obj)
 
+    @cached_permission
     def has_rest_create_permission(self, request, obj=None):
         return self.has_create_permission(request, obj)
 
+    @cached_permission
     def has_rest_update_permission(self, request, obj=None):
         return self.has_update_permission(request, obj)
 
+    @cached_permission
     def has_rest_delete_permission(self, request, obj=None):
         return self.has_delete_permission(request, obj)
+
+
+# Permission methods of the mixins, methods with the same names are cached in cores
+permission_method_names = frozenset(name for klass in (PermissionsMixin, PermissionsUIMixin, PermissionsRestMixin)
+                                    for name in klass.__dict__ if is_permission_method_name(name))
@@ -1,12 +1,16 @@
 from __future__ import unicode_literals
 
+from datetime import timedelta
+
 from django.middleware.csrf import rotate_token
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.contrib.auth.models import AnonymousUser
-from django.contrib.auth.backends import ModelBackend
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Q
+from django.utils import timezone
 
 from is_core.auth_token.models import Token, AnonymousToken
+from is_core.auth_token.cache import get_token_cache
 from is_core import config
 
 
@@ -42,6 +46,7 @@ def logout(request):
     if hasattr(request, 'token') and request.token.is_active:
         token = request.token
         token.is_active = False
+        # Inactive token is removed from the token cache during save
         token.save()
 
 
@@ -51,14 +56,22 @@ def get_token(request):
     If no user is retrieved AnonymousToken is returned.
     """
     auth_token = request.META.get(config.AUTH_HEADER_NAME) or request.COOKIES.get(config.AUTH_COOKIE_NAME)
-    try:
-        token = Token.objects.get(key=auth_token, is_active=True)
-        if not token.is_expired:
-            if auth_token == request.META.get(config.AUTH_HEADER_NAME):
-                token.is_from_header = True
-            return token
-    except ObjectDoesNotExist:
-        pass
+    if not auth_token:
+        return AnonymousToken()
+
+    token_cache = get_token_cache()
+    token = token_cache.get(auth_token)
+    # Last access of the cached token can be older than the stored one (token touched by another process)
+    if token is None or token.is_expired:
+        try:
+            token = Token.objects.select_related('user').get(key=auth_token, is_active=True)
+        except ObjectDoesNotExist:
+            return AnonymousToken()
+        token_cache.set(token)
+
+    if token.is_active and not token.is_expired:
+        token.is_from_header = auth_token == request.META.get(config.AUTH_HEADER_NAME)
+        return token
     return AnonymousToken()
 
 
@@ -67,9 +80,49 @@ def get_user(request):
     Returns the user model instance associated with the given request token.
     If no user is retrieved an instance of `AnonymousUser` is returned.
     """
-    if hasattr(request, 'token'):
-        user_id = request.token.user.pk
-        user = ModelBackend().get_user(user_id) or AnonymousUser()
+    if hasattr(request, 'token') and request.token.is_active:
+        # User is loaded together with the token
+        user = request.token.user
     else:
         user = AnonymousUser()
     return user
+
+
+def get_purgeable_tokens(now=None):
+    """
+    Returns queryset of inactive and expired tokens.
+    """
+    # Expired tokens are selected the same way as by Token.is_expired
+    expired_before = (now or timezone.now()) - timedelta(seconds=config.AUTH_TOKEN_TOUCH_INTERVAL)
+    return Token.objects.filter(
+        Q(is_active=False) |
+        Q(expiration=True, last_access__lt=expired_before - timedelta(seconds=config.AUTH_DEFAULT_TOKEN_AGE)) |
+        Q(expiration=False, last_access__lt=expired_before - timedelta(seconds=config.AUTH_MAX_TOKEN_AGE))
+    )
+
+
+def purge_tokens(batch_size=1000, archive=None, progress=None):
+    """
+    Removes inactive and expired tokens from the database in batches of batch_size tokens.
+    Function archive is called with list of token values dicts of every batch before it is deleted,
+    function progress is called with count of already removed tokens after every batch.
+    Returns count of removed tokens.
+    """
+    now = timezone.now()
+    purged_count = 0
+    while True:
+        qs = get_purgeable_tokens(now).order_by('last_access')
+        if archive:
+            tokens = list(qs.values()[:batch_size])
+            keys = [token['key'] for token in tokens]
+        else:
+            keys = list(qs.values_list('key', flat=True)[:batch_size])
+        if not keys:
+            return purged_count
+
+        if archive:
+            archive(tokens)
+        Token.objects.filter(key__in=keys).delete()
+        purged_count += len(keys)
+        if progress:
+            progress(purged_count)
@@ -0,0 +1,136 @@
+from __future__ import unicode_literals
+
+import copy
+import hashlib
+import pickle
+import threading
+import time
+
+from collections import OrderedDict
+
+from django.core.cache import get_cache
+from django.utils.encoding import force_bytes
+
+from is_core import config
+from is_core.utils import str_to_class
+
+
+# Attributes with permissions cached by the authentication backend, they are not cached with the token
+USER_PERMISSION_CACHE_ATTRS = ('_perm_cache', '_user_perm_cache', '_group_perm_cache')
+
+
+class TokenCache(object):
+    """
+    Cache of tokens with loaded users. Cached token is used instead of the database lookup of every request.
+    """
+
+    enabled = True
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or config.AUTH_TOKEN_CACHE_TIMEOUT
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def _get_cached_token(self, token):
+        """
+        Returns copy of the token with user without cached permissions, changes of permissions are applied
+        immediately.
+        """
+        token = copy.copy(token)
+        user = copy.copy(token.user)
+        for attr_name in USER_PERMISSION_CACHE_ATTRS:
+            user.__dict__.pop(attr_name, None)
+        token.user = user
+        return token
+
+    def set(self, token):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+
+class DummyTokenCache(TokenCache):
+    """
+    Default cache that does not cache anything.
+    """
+
+    enabled = False
+
+    def get(self, key):
+        return None
+
+    def set(self, token):
+        pass
+
+    def delete(self, key):
+        pass
+
+
+class LocMemTokenCache(TokenCache):
+    """
+    In-process LRU cache with timeout. Every process has its own cache, therefore token deactivated by another
+    process can be used until timeout of the cached token expires.
+    """
+
+    def __init__(self, timeout=None, max_size=None):
+        super(LocMemTokenCache, self).__init__(timeout)
+        self.max_size = max_size or config.AUTH_TOKEN_CACHE_SIZE
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            cached_item = self._cache.pop(key, None)
+            if cached_item is None or cached_item[0] < time.time():
+                return None
+            self._cache[key] = cached_item
+        return pickle.loads(cached_item[1])
+
+    def set(self, token):
+        # Tokens are stored pickled, every request obtains its own copy of the token and the user
+        cached_item = (time.time() + self.timeout,
+                       pickle.dumps(self._get_cached_token(token), pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._cache.pop(token.key, None)
+            self._cache[token.key] = cached_item
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+class DjangoTokenCache(TokenCache):
+    """
+    Cache that uses Django cache backend (AUTH_TOKEN_CACHE_ALIAS), it can be shared between processes.
+    """
+
+    def __init__(self, timeout=None, cache_alias=None):
+        super(DjangoTokenCache, self).__init__(timeout)
+        self.cache = get_cache(cache_alias or config.AUTH_TOKEN_CACHE_ALIAS)
+
+    def _get_cache_key(self, key):
+        return 'is_core:auth_token:%s' % hashlib.md5(force_bytes(key)).hexdigest()
+
+    def get(self, key):
+        return self.cache.get(self._get_cache_key(key))
+
+    def set(self, token):
+        self.cache.set(self._get_cache_key(token.key), self._get_cached_token(token), self.timeout)
+
+    def delete(self, key):
+        self.cache.delete(self._get_cache_key(key))
+
+
+_token_cache = None
+
+
+def get_token_cache():
+    global _token_cache
+
+    if _token_cache is None:
+        _token_cache = str_to_class(config.AUTH_TOKEN_CACHE)()
+    return _token_cache
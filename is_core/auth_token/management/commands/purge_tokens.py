@@ -0,0 +1,42 @@
+from __future__ import unicode_literals
+
+import json
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Command(BaseCommand):
+    """
+    Removes inactive and expired tokens. Removed tokens can be archived to the file (one JSON per line).
+    """
+
+    help = 'Removes inactive and expired authorization tokens'
+    option_list = BaseCommand.option_list + (
+        make_option('--batch-size', action='store', dest='batch_size', type='int', default=1000,
+                    help='Number of tokens removed in one query'),
+        make_option('--archive', action='store', dest='archive', default=None,
+                    help='Path to the file where removed tokens are appended'),
+    )
+
+    def handle(self, *args, **options):
+        from is_core.auth_token import purge_tokens
+
+        archive_file = options.get('archive') and open(options.get('archive'), 'a') or None
+
+        def archive(tokens):
+            for token in tokens:
+                archive_file.write(json.dumps(token, cls=DjangoJSONEncoder) + '\n')
+            archive_file.flush()
+
+        def progress(purged_count):
+            self.stdout.write('Removed %s tokens' % purged_count)
+
+        try:
+            purged_count = purge_tokens(options.get('batch_size'), archive_file and archive or None, progress)
+        finally:
+            if archive_file:
+                archive_file.close()
+        self.stdout.write('Total removed tokens: %s' % purged_count)
@@ -42,6 +42,6 @@ class TokenAuthenticationMiddlewares(object):
                 max_age = None
                 expires = None
 
-            request.token.save()
+            request.token.touch()
             response.set_cookie(config.AUTH_COOKIE_NAME, request.token.key, max_age=max_age, expires=expires)
         return response
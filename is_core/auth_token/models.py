@@ -6,10 +6,13 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.db import models
-from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_save, m2m_changed
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Group
 from django.utils import timezone
 
 from is_core import config
+from is_core.auth_token.cache import get_token_cache
 
 
 # Prior to Django 1.5, the AUTH_USER_MODEL setting does not exist.
@@ -32,10 +35,35 @@ class Token(models.Model):
     expiration = models.BooleanField(null=False, default=True)
     is_from_header = False
 
+    class Meta:
+        # Index used by purge of inactive and expired tokens
+        index_together = (('is_active', 'last_access'),)
+
     def save(self, *args, **kwargs):
         if not self.key:
             self.key = self.generate_key()
-        return super(Token, self).save(*args, **kwargs)
+        result = super(Token, self).save(*args, **kwargs)
+        if self.is_active:
+            get_token_cache().set(self)
+        else:
+            get_token_cache().delete(self.key)
+        return result
+
+    def touch(self):
+        """
+        Updates last access of the token. The token is written only if its last access is older than
+        AUTH_TOKEN_TOUCH_INTERVAL, only last_access column is updated.
+        """
+        now = timezone.now()
+        if self.last_access and self.last_access + timedelta(seconds=config.AUTH_TOKEN_TOUCH_INTERVAL) > now:
+            return False
+
+        # Token deactivated by concurrent logout must not be cached again
+        if not Token.objects.filter(pk=self.pk, is_active=True).update(last_access=now):
+            return False
+        self.last_access = now
+        get_token_cache().set(self)
+        return True
 
     def generate_key(self):
         """
@@ -45,8 +73,10 @@ class Token(models.Model):
 
     @property
     def is_expired(self):
+        # Last access is stored with AUTH_TOKEN_TOUCH_INTERVAL precision, the real last access can be at most
+        # AUTH_TOKEN_TOUCH_INTERVAL newer (later accesses are written). Token never expires sooner than its age.
         token_age = self.expiration and config.AUTH_DEFAULT_TOKEN_AGE or config.AUTH_MAX_TOKEN_AGE
-        return self.last_access + timedelta(seconds=token_age) < timezone.now()
+        return self.last_access + timedelta(seconds=token_age + config.AUTH_TOKEN_TOUCH_INTERVAL) < timezone.now()
 
     def __unicode__(self):
         return self.key
@@ -66,3 +96,63 @@ class AnonymousToken(object):
 
     def delete(self):
         raise NotImplementedError
+
+
+def delete_cached_tokens(tokens):
+    for key in tokens.filter(is_active=True).values_list('key', flat=True):
+        get_token_cache().delete(key)
+
+
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """
+    Cached tokens contain user, therefore they must be removed from the cache when the user is changed.
+    """
+    if get_token_cache().enabled:
+        delete_cached_tokens(Token.objects.filter(user=instance))
+
+
+# Names of the user relations with groups and permissions, key is the through model
+user_m2m_field_names = {}
+
+
+def invalidate_user_m2m_tokens(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Groups and permissions of the user are changed, permissions of the cached user are not valid.
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear') or not get_token_cache().enabled:
+        return
+
+    if not reverse:
+        tokens = Token.objects.filter(user=instance)
+    elif pk_set is not None:
+        tokens = Token.objects.filter(user__pk__in=pk_set)
+    else:
+        tokens = Token.objects.filter(**{'user__%s' % user_m2m_field_names[sender]: instance})
+    delete_cached_tokens(tokens)
+
+
+def invalidate_group_tokens(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Permissions of the group are changed, permissions of the cached users of the group are not valid.
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear') or not get_token_cache().enabled:
+        return
+
+    if not reverse:
+        tokens = Token.objects.filter(user__groups=instance)
+    elif pk_set is not None:
+        tokens = Token.objects.filter(user__groups__pk__in=pk_set)
+    else:
+        tokens = Token.objects.filter(user__groups__permissions=instance)
+    delete_cached_tokens(tokens)
+
+
+user_model = get_user_model()
+post_save.connect(invalidate_user_tokens, sender=user_model)
+for field_name in ('groups', 'user_permissions'):
+    if hasattr(user_model, field_name):
+        through = getattr(user_model, field_name).through
+        user_m2m_field_names[through] = field_name
+        m2m_changed.connect(invalidate_user_m2m_tokens, sender=through)
+if hasattr(user_model, 'groups'):
+    m2m_changed.connect(invalidate_group_tokens, sender=Group.permissions.through)
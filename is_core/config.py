@@ -9,6 +9,15 @@ AUTH_DEFAULT_TOKEN_AGE = getattr(settings, 'AUTH_DEFAULT_TOKEN_AGE', 60 * 60)
 # Max token expiration time (default: 2 weeks)
 AUTH_MAX_TOKEN_AGE = getattr(settings, 'AUTH_MAX_TOKEN_AGE', 60 * 60 * 24 * 7 * 2)
 AUTH_USE_TOKENS = getattr(settings, 'AUTH_USE_TOKENS', False)
+# Min interval between writes of token last access, in seconds (default: every request)
+AUTH_TOKEN_TOUCH_INTERVAL = getattr(settings, 'AUTH_TOKEN_TOUCH_INTERVAL', 0)
+# Cache of tokens: DummyTokenCache (no cache), LocMemTokenCache (in-process) or DjangoTokenCache
+AUTH_TOKEN_CACHE = getattr(settings, 'AUTH_TOKEN_CACHE', 'is_core.auth_token.cache.DummyTokenCache')
+# Timeout of cached token, in seconds (default: 1 minute)
+AUTH_TOKEN_CACHE_TIMEOUT = getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 60)
+# Max number of tokens stored in LocMemTokenCache
+AUTH_TOKEN_CACHE_SIZE = getattr(settings, 'AUTH_TOKEN_CACHE_SIZE', 10000)
+AUTH_TOKEN_CACHE_ALIAS = getattr(settings, 'AUTH_TOKEN_CACHE_ALIAS', 'default')
 AUTH_FORM_CLASS = getattr(settings, 'AUTH_FORM_CLASS', AUTH_USE_TOKENS and
                           'is_core.auth_token.forms.TokenAuthenticationForm' or
                           'django.contrib.auth.forms.AuthenticationForm')
@@ -22,6 +31,30 @@ HOME_IS_CORE = getattr(settings, 'HOME_IS_CORE', 'is_core.main.HomeUIISCore')
 HOME_VIEW = getattr(settings, 'HOME_VIEW', 'is_core.generic_views.HomeView')
 MAX_UPLOAD_SIZE = getattr(settings, 'MAX_UPLOAD_SIZE', 20)
 MENU_GENERATOR = getattr(settings, 'MENU_GENERATOR', 'is_core.menu.MenuGenerator')
+# Timeout of cached choices of model select boxes, in seconds (default: choices are not cached)
+CHOICES_CACHE_TIMEOUT = getattr(settings, 'CHOICES_CACHE_TIMEOUT', None)
+# Select boxes with more choices are searched through REST resource (default: always all choices are rendered)
+CHOICES_REMOTE_THRESHOLD = getattr(settings, 'CHOICES_REMOTE_THRESHOLD', None)
+# Timeout of cached rendered filters of table views, in seconds (None turns the cache off)
+FILTERS_CACHE_TIMEOUT = getattr(settings, 'FILTERS_CACHE_TIMEOUT', 60 * 60)
+# Filters of related objects load options from REST resource (default: all options are rendered)
+REMOTE_SELECT_FILTERS = getattr(settings, 'REMOTE_SELECT_FILTERS', False)
+# URL patterns of cores are built with the first request instead of URLconf import
+LAZY_CORE_URLS = getattr(settings, 'LAZY_CORE_URLS', False)
+# Timeout of cached menus of users, in seconds (default: menu is not cached)
+MENU_CACHE_TIMEOUT = getattr(settings, 'MENU_CACHE_TIMEOUT', None)
+# Strategy of X-Total computation: EXACT, NONE, CACHED or ESTIMATE (see is_core.rest.paginator.TOTAL)
+REST_PAGINATOR_TOTAL = getattr(settings, 'REST_PAGINATOR_TOTAL', 'EXACT')
+# Timeout of cached X-Total, in seconds (default: 1 minute)
+REST_PAGINATOR_TOTAL_CACHE_TIMEOUT = getattr(settings, 'REST_PAGINATOR_TOTAL_CACHE_TIMEOUT', 60)
+# Smaller planner estimates are replaced with exact count
+REST_PAGINATOR_TOTAL_ESTIMATE_THRESHOLD = getattr(settings, 'REST_PAGINATOR_TOTAL_ESTIMATE_THRESHOLD', 1000)
+# Number of objects loaded with one query during streamed export
+REST_EXPORT_CHUNK_SIZE = getattr(settings, 'REST_EXPORT_CHUNK_SIZE', 1000)
+# Sink of request measurements: LoggingSink, StatsdSink or MemorySink (default: requests are not measured)
+INSTRUMENTATION_SINK = getattr(settings, 'INSTRUMENTATION_SINK', None)
+INSTRUMENTATION_STATSD_ADDRESS = getattr(settings, 'INSTRUMENTATION_STATSD_ADDRESS', ('localhost', 8125))
+INSTRUMENTATION_STATSD_PREFIX = getattr(settings, 'INSTRUMENTATION_STATSD_PREFIX', 'is_core')
 
 USERNAME = getattr(settings, 'USERNAME', 'username')
 PASSWORD = getattr(settings, 'PASSWORD', 'password')
@@ -2,38 +2,77 @@ from __future__ import unicode_literals
 
 from django.utils.translation import ugettext_lazy as _
 from django.db.models.fields.related import RelatedField
-from django.db.models.fields import FieldDoesNotExist
+from django.db.models.fields import FieldDoesNotExist, CharField
 
 from is_core.filters.exceptions import FilterException
 
 
-def get_model_field_or_method_filter(full_field_term, model, value=None, filter_term=None):
-    if not filter_term:
-        filter_term = full_field_term
+# Resolved filter plans of models, filter term -> (filter key, field or method) or None for not valid filter term
+filter_plans = {}
+
+# Max number of not valid filter terms cached per model, filter terms are obtained from request
+MAX_INVALID_FILTER_PLANS = 1000
+
+
+def _get_field_or_method(model, field_or_method_name):
+    try:
+        return model._meta.get_field(field_or_method_name)
+    except FieldDoesNotExist:
+        # Method is obtained from the model class, no model instance is necessary
+        method = getattr(model, field_or_method_name, None)
+        return isinstance(method, property) and method.fget or method
 
+
+def _resolve_filter_plan(model, filter_term):
     next_filter_term = None
     current_filter_term = filter_term
 
     if '__' in filter_term:
         current_filter_term, next_filter_term = filter_term.split('__', 1)
 
-    field_or_method = None
+    field_or_method = _get_field_or_method(model, current_filter_term)
+    if field_or_method is None:
+        return None
+
+    if (next_filter_term and isinstance(field_or_method, RelatedField)
+            and next_filter_term not in field_or_method.filter.get_suffixes()):
+        return _resolve_filter_plan(field_or_method.rel.to, next_filter_term)
+
+    if getattr(field_or_method, 'filter', None) \
+            and (not next_filter_term or next_filter_term in field_or_method.filter.get_suffixes()):
+        return filter_term, field_or_method
+    return None
+
+
+def get_filter_plan(model, filter_term):
+    """
+    Returns cached tuple (filter key, field or method) resolved from filter term or None if filter term is not valid.
+    """
+    model_filter_plans = filter_plans.setdefault(model, {})
     try:
-        field_or_method = model._meta.get_field(current_filter_term)
+        return model_filter_plans[filter_term]
+    except KeyError:
+        filter_plan = _resolve_filter_plan(model, filter_term)
+        if filter_plan is not None or len(model_filter_plans) < MAX_INVALID_FILTER_PLANS:
+            model_filter_plans[filter_term] = filter_plan
+        return filter_plan
 
-        if (next_filter_term and next_filter_term not in field_or_method.filter.get_suffixes()
-            and isinstance(field_or_method, RelatedField)):
-            return get_model_field_or_method_filter(filter_term, model._meta.get_field(current_filter_term).rel.to,
-                                                    value, next_filter_term)
 
-    except FieldDoesNotExist:
-        try:
-            field_or_method = getattr(model(), current_filter_term)
-        except AttributeError:
-            raise FilterException(_('Not valid filter: %s') % full_field_term)
-
-    if hasattr(field_or_method, 'filter') \
-        and (not next_filter_term or next_filter_term in field_or_method.filter.get_suffixes()) and field_or_method.filter:
-        return field_or_method.filter(filter_term, full_field_term, field_or_method, value)
-    else:
+def get_model_field_or_method_filter(full_field_term, model, value=None, filter_term=None):
+    filter_plan = get_filter_plan(model, filter_term or full_field_term)
+    if filter_plan is None:
         raise FilterException(_('Not valid filter: %s') % full_field_term)
+
+    filter_key, field_or_method = filter_plan
+    return field_or_method.filter(filter_key, full_field_term, field_or_method, value)
+
+
+def get_search_filter_key(model):
+    """
+    Returns filter key that is used for searching of the model objects through REST resource (contains of the first
+    text field) or None if the model has no text field.
+    """
+    for field in model._meta.fields:
+        if isinstance(field, CharField) and not field.choices:
+            return '%s__icontains' % field.name
+    return None
@@ -10,7 +10,10 @@ from django.db.models.fields import AutoField, DateField, DateTimeField, Decimal
 
 from dateutil.parser import DEFAULTPARSER
 
+from is_core import config
+from is_core.filters import get_search_filter_key
 from is_core.filters.exceptions import FilterException
+from is_core.forms.widgets import RemoteSelect
 
 
 class Filter(object):
@@ -161,6 +164,21 @@ class RelatedFieldFilter(DefaultFieldFilter):
         widget = super(RelatedFieldFilter, self).get_widget()
         return widget
 
+    def get_rest_core(self):
+        from is_core.site import get_model_rest_core
+
+        return get_model_rest_core(self.field.rel.to)
+
+    def render(self, request):
+        # Options of the related objects can be loaded from the REST resource instead of rendering whole queryset
+        core = config.REMOTE_SELECT_FILTERS and self.get_rest_core() or None
+        if not core:
+            return super(RelatedFieldFilter, self).render(request)
+
+        widget = RemoteSelect(core.get_api_url(request), empty_label=self.get_placeholder() or self.EMPTY_LABEL,
+                              search_filter_key=get_search_filter_key(self.field.rel.to))
+        return widget.render('filter__%s' % self.get_filter_name(), None, attrs=self.get_attrs_for_widget())
+
     def get_filter_term(self, request):
         if '__' not in self.filter_key:
             return super(RelatedFieldFilter, self).get_filter_term(request)
@@ -1,15 +1,84 @@
 from __future__ import unicode_literals
 
+import hashlib
+import time
+
 from django import forms
+from django.core.cache import cache
+from django.core.validators import EMPTY_VALUES
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.fields.related import RelatedField, ForeignKey
+from django.db.models.signals import post_save, post_delete
+from django.db.models.sql.datastructures import EmptyResultSet
 from django.forms import models
 from django.forms.fields import ChoiceField
+from django.forms.formsets import INITIAL_FORM_COUNT, TOTAL_FORM_COUNT
+from django.utils.encoding import force_text, force_bytes
+from django.utils.translation import get_language
 
+from is_core import config
+from is_core.filters import get_search_filter_key
 from is_core.forms import widgets
 from is_core.utils.models import get_model_field_value
 
 
 class BaseInlineFormSet(models.BaseInlineFormSet):
 
+    def __init__(self, *args, **kwargs):
+        """
+        Forms of the paginated formset are numbered across all pages, initial forms of the page continue numbering
+        of the previous pages and extra forms follow initial forms of the last page. Management form contains
+        counts of all pages.
+        """
+        self.paginated = kwargs.pop('paginated', False)
+        self.form_index_offset = kwargs.pop('form_index_offset', 0)
+        self.all_initial_form_count = kwargs.pop('all_initial_form_count', 0)
+        self.page_only = False
+        self._form_indexes = None
+        super(BaseInlineFormSet, self).__init__(*args, **kwargs)
+
+    def get_form_indexes(self):
+        if self._form_indexes is None:
+            if self.is_bound:
+                # Only initial forms of the loaded pages are submitted
+                management_data = self.management_form.cleaned_data
+                pk_name = self.model._meta.pk.name
+                initial_indexes = [i for i in range(management_data[INITIAL_FORM_COUNT])
+                                   if '%s-%s-%s' % (self.prefix, i, pk_name) in self.data]
+                extra_indexes = range(management_data[INITIAL_FORM_COUNT], management_data[TOTAL_FORM_COUNT])
+            else:
+                initial_form_count = super(BaseInlineFormSet, self).initial_form_count()
+                extra_form_count = super(BaseInlineFormSet, self).total_form_count() - initial_form_count
+                initial_indexes = range(self.form_index_offset, self.form_index_offset + initial_form_count)
+                extra_indexes = range(self.all_initial_form_count, self.all_initial_form_count + extra_form_count)
+            self._form_indexes = (list(initial_indexes), list(extra_indexes))
+        return self._form_indexes
+
+    def initial_form_count(self):
+        if self.paginated and self.is_bound:
+            return len(self.get_form_indexes()[0])
+        return super(BaseInlineFormSet, self).initial_form_count()
+
+    def total_form_count(self):
+        if self.paginated and self.is_bound:
+            initial_indexes, extra_indexes = self.get_form_indexes()
+            return min(len(initial_indexes) + len(extra_indexes), self.absolute_max)
+        return super(BaseInlineFormSet, self).total_form_count()
+
+    @property
+    def management_form(self):
+        form = super(BaseInlineFormSet, self).management_form
+        if self.paginated and not self.is_bound:
+            form.initial[TOTAL_FORM_COUNT] = self.all_initial_form_count + len(self.get_form_indexes()[1])
+            form.initial[INITIAL_FORM_COUNT] = self.all_initial_form_count
+        return form
+
+    def add_prefix(self, index):
+        if self.paginated and isinstance(index, int):
+            initial_indexes, extra_indexes = self.get_form_indexes()
+            index = (initial_indexes + extra_indexes)[index]
+        return super(BaseInlineFormSet, self).add_prefix(index)
+
     def save_existing_objects(self, commit=True):
         self.changed_objects = []
         self.deleted_objects = []
@@ -41,6 +110,13 @@ class BaseInlineFormSet(models.BaseInlineFormSet):
         return saved_instances
 
     def all_forms(self):
+        if self.page_only:
+            # Further pages of the paginated formset contain only initial forms, management form and extra forms are
+            # rendered with the first page
+            for form in self.initial_forms:
+                yield form
+            return
+
         for form in self.forms:
             yield form
 
@@ -56,27 +132,197 @@ class ModelChoice(list):
         self.attrs = attrs
 
 
+def _get_choices_version_cache_key(model):
+    return 'is_core:choices:version:%s' % model._meta.db_table
+
+
+def get_choices_version(model):
+    # Initial version is a timestamp, choices cached before eviction of the version key are not used again
+    cache.add(_get_choices_version_cache_key(model), int(time.time() * 1000), None)
+    return cache.get(_get_choices_version_cache_key(model))
+
+
+def invalidate_choices(sender, **kwargs):
+    """
+    Cached choices of the model are invalidated with every change of the model objects.
+    """
+    try:
+        cache.incr(_get_choices_version_cache_key(sender))
+    except ValueError:
+        # Version does not exist, the next one is a new timestamp
+        pass
+
+
+# Models whose changes invalidate cached choices
+choices_cached_models = set()
+
+
+def connect_invalidate_choices(model):
+    if model not in choices_cached_models:
+        post_save.connect(invalidate_choices, sender=model)
+        post_delete.connect(invalidate_choices, sender=model)
+        choices_cached_models.add(model)
+
+
+def _get_related_value_field_models(model, field_name):
+    """
+    Returns list of the related models of the field path (nested fields are joined with __) if its value is a plain
+    field of the related objects that can be loaded with values_list, otherwise returns None.
+    """
+    current_field_name, next_field_name = (field_name.split('__', 1) + [None])[:2]
+    try:
+        field = model._meta.get_field(current_field_name)
+    except FieldDoesNotExist:
+        return None
+
+    if next_field_name:
+        if not isinstance(field, ForeignKey):
+            return None
+        related_models = _get_related_value_field_models(field.rel.to, next_field_name)
+        if related_models is None:
+            return None
+        return [field.rel.to] + related_models
+    elif field.choices or isinstance(field, RelatedField):
+        # Fields with choices are displayed with get_FOO_display
+        return None
+    return []
+
+
+def get_choices_models(model):
+    """
+    Returns models whose objects are displayed in choices of the model: the model, models of the foreign keys
+    (they can be used in labels) and related models of the extra select box fields.
+    """
+    choices_models = [model]
+    for field in model._meta.concrete_fields:
+        if isinstance(field, ForeignKey) and field.rel.to not in choices_models:
+            choices_models.append(field.rel.to)
+    for val in model._ui_meta.extra_selecbox_fields.values():
+        for related_model in _get_related_value_field_models(model, val) or ():
+            if related_model not in choices_models:
+                choices_models.append(related_model)
+    return choices_models
+
+
 class ModelChoiceIterator(forms.models.ModelChoiceIterator):
 
+    def __init__(self, field):
+        super(ModelChoiceIterator, self).__init__(field)
+        self.loaded_choices = None
+
     def __iter__(self):
         if self.field.empty_label is not None:
             yield ModelChoice("", self.field.empty_label)
         if self.field.cache_choices:
             if self.field.choice_cache is None:
-                self.field.choice_cache = [
-                    self.choice(obj) for obj in self.queryset.all()
-                ]
+                self.field.choice_cache = self.get_choices()
             for choice in self.field.choice_cache:
                 yield choice
         else:
-            for obj in self.queryset.all():
-                yield self.choice(obj)
+            # Choices can be loaded with check of the remote search threshold
+            choices, self.loaded_choices = self.loaded_choices, None
+            for choice in (choices if choices is not None else self.get_choices()):
+                yield choice
 
-    def choice(self, obj):
+    def choice(self, obj, related_values=None):
         attrs = {}
         for key, val in obj._ui_meta.extra_selecbox_fields.items():
-            attrs[key] = get_model_field_value(val, obj)
-        return ModelChoice(self.field.prepare_value(obj), self.field.label_from_instance(obj), attrs)
+            if related_values and val in related_values:
+                attrs[key] = related_values[val]
+            else:
+                attrs[key] = get_model_field_value(val, obj)
+        return ModelChoice(self.field.prepare_value(obj), force_text(self.field.label_from_instance(obj)), attrs)
+
+    def load_choices(self, queryset):
+        """
+        Choices are loaded with one values_list query. Objects for labels are constructed from the model columns,
+        extra select box fields of the related objects are loaded as columns of the same query.
+        """
+        model = queryset.model
+        field_names = [field.name for field in model._meta.concrete_fields]
+        related_field_names = [val for val in model._ui_meta.extra_selecbox_fields.values()
+                               if '__' in val and _get_related_value_field_models(model, val) is not None]
+        return [self.choice(model(*values[:len(field_names)]),
+                            dict(zip(related_field_names, values[len(field_names):])))
+                for values in queryset.values_list(*(field_names + related_field_names))]
+
+    def _get_choices_cache_key(self, queryset):
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+        choices_models = get_choices_models(queryset.model)
+        for choices_model in choices_models:
+            connect_invalidate_choices(choices_model)
+        return 'is_core:choices:%s:%s' % (
+            queryset.model._meta.db_table, hashlib.md5(force_bytes(repr((
+                sql, params, sorted(queryset.model._ui_meta.extra_selecbox_fields.items()),
+                '%s.%s' % (self.field.__class__.__module__, self.field.__class__.__name__),
+                self.field.to_field_name, get_language(),
+                [(choices_model._meta.db_table, get_choices_version(choices_model))
+                 for choices_model in choices_models]
+            )))).hexdigest()
+        )
+
+    def get_choices(self):
+        """
+        Returns list of choices without empty choice. If CHOICES_CACHE_TIMEOUT is set, choices are cached according
+        to the queryset (limit_choices_to), extra select box fields and language, they are invalidated with changes
+        of the objects of the model and its related models.
+        """
+        queryset = self.queryset.all()
+        if config.CHOICES_CACHE_TIMEOUT is None:
+            return self.load_choices(queryset)
+
+        try:
+            cache_key = self._get_choices_cache_key(queryset)
+        except EmptyResultSet:
+            return []
+
+        choices = cache.get(cache_key)
+        if choices is None:
+            choices = self.load_choices(queryset)
+            cache.set(cache_key, choices, config.CHOICES_CACHE_TIMEOUT)
+        return choices
+
+    def get_remote_resource_url(self):
+        """
+        Returns URL of the REST resource if the number of choices is bigger than CHOICES_REMOTE_THRESHOLD,
+        choices are searched remotely.
+        """
+        from is_core.site import get_model_rest_core
+
+        if config.CHOICES_REMOTE_THRESHOLD is None or self.field.cache_choices:
+            return None
+
+        core = get_model_rest_core(self.queryset.model)
+        if core is None:
+            return None
+
+        if config.CHOICES_CACHE_TIMEOUT is None:
+            # Choices are loaded only up to the threshold, if it is not exceeded they are rendered without next query
+            choices = self.load_choices(self.queryset.all()[:config.CHOICES_REMOTE_THRESHOLD + 1])
+        else:
+            choices = self.get_choices()
+
+        if len(choices) <= config.CHOICES_REMOTE_THRESHOLD:
+            self.loaded_choices = choices
+            return None
+        return core.get_api_url(None)
+
+    def get_remote_search_filter_key(self):
+        return get_search_filter_key(self.queryset.model)
+
+    def get_selected_choices(self, values):
+        """
+        Returns choices of the selected values only, it is used with remote search.
+        """
+        choices = []
+        if self.field.empty_label is not None:
+            choices.append(ModelChoice("", self.field.empty_label))
+        values = [value for value in values if value not in EMPTY_VALUES]
+        if values:
+            choices += self.load_choices(self.queryset.filter(
+                **{'%s__in' % (self.field.to_field_name or 'pk'): values}
+            ))
+        return choices
 
 
 class ModelChoiceFieldMixin(object):
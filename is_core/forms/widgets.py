@@ -43,6 +43,25 @@ class WrapperWidget(forms.Widget):
 
 class SelectMixin(object):
 
+    def render(self, name, value, attrs=None, choices=()):
+        get_remote_resource_url = getattr(self.choices, 'get_remote_resource_url', None)
+        resource_url = get_remote_resource_url and get_remote_resource_url()
+        if not resource_url:
+            return super(SelectMixin, self).render(name, value, attrs, choices)
+
+        # Only selected choices are rendered, other choices are searched through the REST resource
+        choices_iterator = self.choices
+        values = value if isinstance(value, (list, tuple)) else [value]
+        self.choices = choices_iterator.get_selected_choices(values)
+        try:
+            remote_attrs = {'data-resource': resource_url}
+            search_filter_key = choices_iterator.get_remote_search_filter_key()
+            if search_filter_key:
+                remote_attrs['data-search'] = search_filter_key
+            return super(SelectMixin, self).render(name, value, dict(attrs or {}, **remote_attrs), choices)
+        finally:
+            self.choices = choices_iterator
+
     def render_option(self, selected_choices, option_value, option_label, option_attrs):
         option_value = force_text(option_value)
         if option_value in selected_choices:
@@ -86,6 +105,22 @@ class MultipleSelect(SelectMixin, forms.SelectMultiple):
     placeholder = _('Search...')
 
 
+class RemoteSelect(forms.Select):
+    """
+    Select without options, options are loaded asynchronously from the REST resource (data-resource attribute)
+    and searched with filter key in data-search attribute (js/remote-select.js).
+    """
+
+    class_name = 'remote-select'
+
+    def __init__(self, resource_url, attrs=None, empty_label='', search_filter_key=None):
+        attrs = dict(attrs or {})
+        attrs.update({'data-resource': resource_url, 'class': self.class_name})
+        if search_filter_key:
+            attrs['data-search'] = search_filter_key
+        super(RemoteSelect, self).__init__(attrs, choices=(('', empty_label),))
+
+
 class DragAndDropFileInput(forms.ClearableFileInput):
 
     def render(self, name, value, attrs={}):
@@ -4,6 +4,7 @@ from django.views.generic.base import TemplateView, View
 from django.utils.translation import ugettext_lazy as _
 
 from is_core.menu import LinkMenuItem
+from is_core.instrumentation import phase, set_instrumentation_names
 
 from block_snippets.views import JsonSnippetTemplateResponseMixin
 
@@ -73,7 +74,9 @@ class DefaultCoreViewMixin(DefaultViewMixin):
 
     def dispatch(self, request, *args, **kwargs):
         self.core.init_ui_request(request)
-        return super(DefaultCoreViewMixin, self).dispatch(request, *args, **kwargs)
+        set_instrumentation_names(request, self.core, getattr(self, 'pattern', None))
+        with phase(request, 'view'):
+            return super(DefaultCoreViewMixin, self).dispatch(request, *args, **kwargs)
 
     def get_title(self):
         return self.title or self.model._meta.verbose_name
@@ -12,10 +12,11 @@ from django.contrib.messages import constants
 
 from is_core.generic_views.exceptions import SaveObjectException
 from is_core.generic_views import DefaultModelCoreViewMixin
-from is_core.utils import flatten_fieldsets
-from is_core.utils.forms import formset_has_file_field
+from is_core.utils import flatten_fieldsets, is_overridden
+from is_core.utils.forms import formset_has_file_field, cached_modelform_factory
 from is_core.generic_views.mixins import ListParentMixin, GetCoreObjViewMixin
 from is_core.generic_views.inlines.inline_form_views import InlineFormView
+from is_core.auth.main import clear_permission_cache
 
 
 class DefaultFormView(DefaultModelCoreViewMixin, FormView):
@@ -240,12 +241,32 @@ class DefaultModelFormView(DefaultFormView):
         exclude = list(self.get_exclude()) + list(readonly_fields)
         if hasattr(form_class, '_meta') and form_class._meta.exclude:
             exclude.extend(form_class._meta.exclude)
-        return modelform_factory(self.model, form=form_class, exclude=exclude, fields=fields,
-                                 formfield_callback=self.formfield_for_dbfield)
+        if is_overridden(self, DefaultModelFormView, 'formfield_for_dbfield'):
+            # Overridden formfield_for_dbfield can depend on the view instance, form class cannot be cached
+            return modelform_factory(self.model, form=form_class, exclude=exclude, fields=fields,
+                                     formfield_callback=self.formfield_for_dbfield)
+        # Default formfield_for_dbfield is the same as the default behaviour of modelform_factory
+        return cached_modelform_factory(self.model, form=form_class, exclude=exclude, fields=fields)
 
     def formfield_for_dbfield(self, db_field, **kwargs):
         return db_field.formfield(**kwargs)
 
+    def render_inline_pages(self, context):
+        inline_pages = {}
+        for name, inline_form_view in (context.get('inline_form_views') or {}).items():
+            if inline_form_view.is_page_requested():
+                inline_pages[name] = inline_form_view.render(context.copy(), None)
+        return inline_pages
+
+    def render_to_response(self, context, **response_kwargs):
+        if self.has_snippet():
+            # Further pages of the paginated inline views are sent with the snippet
+            inline_pages = self.render_inline_pages(context)
+            if inline_pages:
+                extra_content = response_kwargs['extra_content'] = response_kwargs.get('extra_content', {})
+                extra_content['inline_pages'] = inline_pages
+        return super(DefaultModelFormView, self).render_to_response(context, **response_kwargs)
+
     def get_has_file_field(self, form, inline_form_views=(), **kwargs):
         if super(DefaultModelFormView, self).get_has_file_field(form, **kwargs):
             return True
@@ -386,6 +407,7 @@ class DefaultCoreModelFormView(ListParentMixin, DefaultModelFormView):
 
     def post_save_obj(self, obj, form, change):
         self.core.post_save_model(self.request, obj, form, change)
+        clear_permission_cache(self.request)
 
     def get_message(self, type, obj=None):
         msg_dict = {}
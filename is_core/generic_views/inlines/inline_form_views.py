@@ -1,6 +1,10 @@
 from __future__ import unicode_literals
 
-from django.forms.models import inlineformset_factory, ModelForm
+from django.core.exceptions import ValidationError
+from django.db.models.fields.related import RelatedField
+from django.forms.formsets import INITIAL_FORM_COUNT
+from django.forms.models import inlineformset_factory, ModelForm, _get_foreign_key
+from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _
 
 from is_core.forms.models import BaseInlineFormSet
@@ -8,6 +12,11 @@ from is_core.utils.forms import formset_has_file_field
 from is_core.generic_views.inlines import InlineView
 
 
+# Generated formset classes, key is (inline view class, parent model, model, fk name, form class, base formset class,
+# fields, readonly fields, extra, can delete, max num, exclude)
+formset_factories = {}
+
+
 class InlineFormView(InlineView):
     form_class = ModelForm
     model = None
@@ -23,6 +32,7 @@ class InlineFormView(InlineView):
     fields = None
     initial = []
     base_inline_formset_class = BaseInlineFormSet
+    paginate_by = None
 
     def __init__(self, request, parent_view, parent_instance):
         super(InlineFormView, self).__init__(request, parent_view, parent_instance)
@@ -30,6 +40,8 @@ class InlineFormView(InlineView):
         self.core = parent_view.core
         self.parent_instance = parent_instance
         self.readonly = self.is_readonly()
+        self.has_next_page = False
+        self.all_initial_form_count = 0
         if self.extra < self.min_num:
             self.extra = self.min_num
 
@@ -50,6 +62,8 @@ class InlineFormView(InlineView):
             class_names.append('can-add')
         if formset.can_delete:
             class_names.append('can-delete')
+        if self.paginate_by:
+            class_names.append('paginated')
 
         if kwargs.get('title'):
             class_names.append('with-title')
@@ -62,6 +76,7 @@ class InlineFormView(InlineView):
                             'name': self.get_name(),
                             'button_value': self.get_button_value(),
                             'class_names': class_names,
+                            'next_page_url': self.get_next_page_url(),
                         })
 
         return context_data
@@ -101,29 +116,124 @@ class InlineFormView(InlineView):
     def get_formset_factory(self, fields=None, readonly_fields=()):
         extra = self.get_extra()
         exclude = list(self.get_exclude()) + list(readonly_fields)
-        return inlineformset_factory(self.parent_model, self.model, form=self.form_class,
-                                     fk_name=self.fk_name, extra=extra, formset=self.base_inline_formset_class,
-                                     can_delete=self.get_can_delete(), exclude=exclude,
-                                     fields=fields, max_num=self.max_num)
+        can_delete = self.get_can_delete()
+
+        # Formset classes are generated only once for every inline view class and formset parameters
+        key = (self.__class__, self.parent_model, self.model, self.fk_name, self.form_class,
+               self.base_inline_formset_class, fields is not None and tuple(fields) or None, tuple(readonly_fields),
+               extra, can_delete, self.max_num, tuple(exclude))
+        formset_factory = formset_factories.get(key)
+        if formset_factory is None:
+            formset_factory = formset_factories[key] = inlineformset_factory(
+                self.parent_model, self.model, form=self.form_class, fk_name=self.fk_name, extra=extra,
+                formset=self.base_inline_formset_class, can_delete=can_delete, exclude=exclude, fields=fields,
+                max_num=self.max_num
+            )
+        return formset_factory
 
     def get_queryset(self):
-        return self.model.objects.all()
+        queryset = self.model.objects.all()
+        if self.parent_instance.pk is None:
+            return queryset
+
+        # Only children of the parent instance are loaded, related objects of readonly fields are joined
+        fk = _get_foreign_key(self.parent_model, self.model, fk_name=self.fk_name)
+        readonly_fields = self.get_readonly_fields()
+        queryset = queryset.filter(**{fk.name: self.parent_instance})
+        related_field_names = [field.name for field in self.model._meta.fields
+                               if isinstance(field, RelatedField) and field != fk and field.name in readonly_fields]
+        if related_field_names:
+            queryset = queryset.select_related(*related_field_names)
+        return queryset
+
+    def get_page_param(self):
+        return '%s-page' % self.get_prefix()
+
+    def get_page(self):
+        try:
+            return max(int(self.request.GET.get(self.get_page_param(), 1)), 1)
+        except ValueError:
+            return 1
+
+    def is_page_requested(self):
+        return bool(self.paginate_by) and self.get_page_param() in self.request.GET
+
+    def get_next_page_url(self):
+        """
+        URL of the next page of the paginated inline, page is loaded as a snippet of the parent view.
+        """
+        if not self.has_next_page:
+            return None
+        return '%s?%s' % (self.request.path, urlencode({self.get_page_param(): self.get_page() + 1}))
+
+    def is_paginated(self):
+        return bool(self.paginate_by) and self.parent_instance.pk is not None
+
+    def get_page_offset(self):
+        return (self.get_page() - 1) * self.paginate_by
+
+    def get_submitted_pks(self, data):
+        try:
+            initial_form_count = int(data.get('%s-%s' % (self.get_prefix(), INITIAL_FORM_COUNT), 0))
+        except ValueError:
+            return []
+
+        pk_field = self.model._meta.pk
+        pks = []
+        for i in range(initial_form_count):
+            try:
+                pk = pk_field.to_python(data.get('%s-%s-%s' % (self.get_prefix(), i, pk_field.name)))
+            except ValidationError:
+                continue
+            if pk is not None:
+                pks.append(pk)
+        return pks
+
+    def get_page_queryset(self, data):
+        """
+        Paginated inline loads only one page of the objects, POST contains only objects of the loaded pages.
+        """
+        queryset = self.get_queryset()
+        if not self.is_paginated():
+            return queryset
+
+        if data:
+            return queryset.filter(pk__in=self.get_submitted_pks(data))
+
+        if not queryset.ordered:
+            queryset = queryset.order_by(self.model._meta.pk.name)
+        offset = self.get_page_offset()
+        pks = list(queryset.values_list('pk', flat=True)[offset:offset + self.paginate_by + 1])
+        self.has_next_page = len(pks) > self.paginate_by
+        if not self.is_page_requested():
+            # Management form of the first page contains count of objects of all pages
+            self.all_initial_form_count = offset + len(pks) if not self.has_next_page else queryset.count()
+        return queryset.filter(pk__in=pks[:self.paginate_by])
 
     def get_formset(self, instance, data, files):
         fields = self.get_fields()
         readonly_fields = self.get_readonly_fields()
+        queryset = self.get_page_queryset(data)
 
         if data:
             formset = self.get_formset_factory(fields, readonly_fields)(data=data, files=files, instance=instance,
-                                                                        queryset=self.get_queryset(),
-                                                                        prefix=self.get_prefix())
+                                                                        queryset=queryset,
+                                                                        prefix=self.get_prefix(),
+                                                                        paginated=self.is_paginated())
+        elif self.is_paginated():
+            formset = self.get_formset_factory(fields, readonly_fields)(
+                instance=instance, queryset=queryset, initial=self.get_initial(), prefix=self.get_prefix(),
+                paginated=True, form_index_offset=self.get_page_offset(),
+                all_initial_form_count=self.all_initial_form_count
+            )
         else:
-            formset = self.get_formset_factory(fields, readonly_fields)(instance=instance, queryset=self.get_queryset(),
+            formset = self.get_formset_factory(fields, readonly_fields)(instance=instance, queryset=queryset,
                                                                         initial=self.get_initial(),
                                                                         prefix=self.get_prefix())
 
         formset.can_add = self.get_can_add()
         formset.can_delete = self.get_can_delete()
+        formset.page_only = self.is_page_requested()
 
         for form in formset:
             form.class_names = self.form_class_names(form)
@@ -1,15 +1,28 @@
 from __future__ import unicode_literals
 
+import hashlib
+
+from django.core.cache import cache
 from django.views.generic.base import TemplateView
 from django.db.models.fields import FieldDoesNotExist
+from django.db.models.fields.related import RelatedField
+from django.utils.encoding import force_bytes
+from django.utils.translation import get_language
 
+from is_core import config
 from is_core.utils import query_string_from_dict
 from is_core.generic_views import DefaultModelCoreViewMixin
 from is_core.filters import get_model_field_or_method_filter
+from is_core.filters.exceptions import FilterException
+from is_core.forms.models import get_choices_version, connect_invalidate_choices
 
 from is_core.filters.default_filters import *
 
 
+# Resolved headers of table views, key is (view class, core, list display, language)
+headers_cache = {}
+
+
 class Header(object):
 
     def __init__(self, field_name, text, sortable, filter=''):
@@ -58,22 +71,77 @@ class TableViewMixin(object):
 
         try:
             field = model._meta.get_field(field_name)
-            return Header(full_field_name, field.verbose_name, True, self.get_filter(full_field_name))
+            return Header(full_field_name, field.verbose_name, True)
         except FieldDoesNotExist:
-            return Header(full_field_name, getattr(getattr(model(), field_name), 'short_description', ''), False,
-                          self.get_filter(full_field_name))
+            # Method is obtained from the model class, no model instance is necessary
+            method = getattr(model, field_name)
+            method = isinstance(method, property) and method.fget or method
+            return Header(full_field_name, getattr(method, 'short_description', ''), False)
 
     def get_list_display(self):
         return self.list_display
 
+    def _get_headers_cache_key(self, list_display):
+        return (self.__class__, getattr(self, 'core', None),
+                tuple(isinstance(field, list) and tuple(field) or field for field in list_display), get_language())
+
+    def _get_filter_models(self, field_names):
+        # Options of the related field filters are objects of the related models
+        filter_models = []
+        for field_name in field_names:
+            try:
+                filter = get_model_field_or_method_filter(field_name, self.model)
+            except FilterException:
+                continue
+            if isinstance(getattr(filter, 'field', None), RelatedField):
+                filter_models.append(filter.field.rel.to)
+        return filter_models
+
+    def _get_filters_cache_key(self, field_names, filter_models):
+        return 'is_core:filters:%s' % hashlib.md5(force_bytes(repr((
+            '%s.%s' % (self.__class__.__module__, self.__class__.__name__), self.get_menu_group_pattern_name(),
+            field_names, get_language(),
+            [(filter_model._meta.db_table, get_choices_version(filter_model)) for filter_model in filter_models]
+        )))).hexdigest()
+
+    def get_filters(self, field_names):
+        """
+        Returns dict of rendered filters of the fields. If FILTERS_CACHE_TIMEOUT is set, filters are cached for view,
+        list display and language, cache is invalidated with changes of the related models (options of filters).
+        """
+        if config.FILTERS_CACHE_TIMEOUT is None:
+            return dict((field_name, self.get_filter(field_name)) for field_name in field_names)
+
+        filter_models = self._get_filter_models(field_names)
+        for filter_model in filter_models:
+            connect_invalidate_choices(filter_model)
+
+        cache_key = self._get_filters_cache_key(field_names, filter_models)
+        filters = cache.get(cache_key)
+        if filters is None:
+            filters = dict((field_name, self.get_filter(field_name)) for field_name in field_names)
+            cache.set(cache_key, filters, config.FILTERS_CACHE_TIMEOUT)
+        return filters
+
     def get_headers(self):
-        headers = []
-        for field in self.get_list_display():
-            if isinstance(field, (tuple, list)):
-                headers.append(self.get_header(field[0]))
-            else:
-                headers.append(self.get_header(field))
-        return headers
+        """
+        Headers are resolved only once for view, list display and language, filters are rendered with get_filters.
+        """
+        list_display = self.get_list_display()
+        cache_key = self._get_headers_cache_key(list_display)
+        headers = headers_cache.get(cache_key)
+        if headers is None:
+            headers = []
+            for field in list_display:
+                if isinstance(field, (tuple, list)):
+                    headers.append(self.get_header(field[0]))
+                else:
+                    headers.append(self.get_header(field))
+            headers_cache[cache_key] = headers
+
+        filters = self.get_filters(tuple(header.field_name for header in headers))
+        return [Header(header.field_name, header.text, header.sortable, filters.get(header.field_name, ''))
+                for header in headers]
 
     def get_api_url(self):
         return self.api_url
@@ -0,0 +1,257 @@
+from __future__ import unicode_literals
+
+import logging
+import socket
+import time
+
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections, DEFAULT_DB_ALIAS
+
+from is_core import config
+from is_core.utils import str_to_class
+
+
+logger = logging.getLogger('is-core')
+
+
+class Instrumentation(object):
+    """
+    Measurements of one request: wall time and number of DB queries of every phase, core and pattern name.
+    """
+
+    def __init__(self, request):
+        self.method = request.method
+        self.path = request.path
+        self.core_name = None
+        self.pattern_name = None
+        self.phases = []
+        self.depth = 0
+
+    def add_phase(self, name, duration, queries):
+        self.phases.append((name, duration, queries))
+
+    def get_phase(self, name):
+        # Outer phase of nested phases with the same name is finished as the last one
+        for phase_name, duration, queries in reversed(self.phases):
+            if phase_name == name:
+                return duration, queries
+        return 0, 0
+
+    def add_remainder_phase(self, name, total_phase_name, phase_name):
+        """
+        Adds phase that takes the rest of the total phase that is not measured by the other phase.
+        """
+        total_duration, total_queries = self.get_phase(total_phase_name)
+        duration, queries = self.get_phase(phase_name)
+        self.add_phase(name, max(total_duration - duration, 0), max(total_queries - queries, 0))
+
+    def get_server_timing(self):
+        return ', '.join('%s;dur=%.3f;desc="%s queries"' % (name, duration * 1000, queries)
+                         for name, duration, queries in self.phases)
+
+
+class InstrumentationSink(object):
+
+    def record(self, instrumentation):
+        raise NotImplementedError
+
+
+class LoggingSink(InstrumentationSink):
+
+    def record(self, instrumentation):
+        logger.info('%s %s (core: %s, pattern: %s) %s', instrumentation.method, instrumentation.path,
+                    instrumentation.core_name, instrumentation.pattern_name,
+                    ', '.join('%s %.3fs %s queries' % phase for phase in instrumentation.phases))
+
+
+class StatsdSink(InstrumentationSink):
+    """
+    Sends timers of phases and counters of DB queries to statsd daemon with UDP, errors are ignored.
+    """
+
+    def __init__(self):
+        self.address = config.INSTRUMENTATION_STATSD_ADDRESS
+        self.prefix = config.INSTRUMENTATION_STATSD_PREFIX
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _get_metric_name(self, instrumentation, phase_name):
+        return '.'.join(force_metric_part(part) for part in (self.prefix, instrumentation.core_name,
+                                                                instrumentation.pattern_name, phase_name))
+
+    def record(self, instrumentation):
+        lines = []
+        for name, duration, queries in instrumentation.phases:
+            metric_name = self._get_metric_name(instrumentation, name)
+            lines.append('%s.time:%d|ms' % (metric_name, duration * 1000))
+            lines.append('%s.queries:%d|c' % (metric_name, queries))
+        lines.append('%s:1|c' % self._get_metric_name(instrumentation, 'requests'))
+        try:
+            self.socket.sendto('\n'.join(lines).encode('utf-8'), self.address)
+        except socket.error:
+            pass
+
+
+class MemorySink(InstrumentationSink):
+    """
+    Stores measurements in the process memory, it is intended for tests.
+    """
+
+    def __init__(self):
+        self.measurements = []
+
+    def record(self, instrumentation):
+        self.measurements.append(instrumentation)
+
+    def clear(self):
+        self.measurements = []
+
+
+class QueryCountingCursor(object):
+    """
+    Cursor wrapper that counts executed queries, it does not depend on DEBUG or debug cursor of the connection.
+    """
+
+    def __init__(self, cursor, counter):
+        self.cursor = cursor
+        self.counter = counter
+
+    def execute(self, *args, **kwargs):
+        self.counter.queries += 1
+        return self.cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self.counter.queries += 1
+        return self.cursor.executemany(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self.cursor, attr)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class QueryCounter(object):
+
+    def __init__(self):
+        self.queries = 0
+
+
+@contextmanager
+def count_queries():
+    """
+    Counts queries of the default DB connection executed in the code block, nested blocks are counted by all of them.
+    """
+    db_connection = connections[DEFAULT_DB_ALIAS]
+    counter = QueryCounter()
+    # Cursor method of the connection is patched by the outer block
+    outer_cursor = db_connection.__dict__.get('cursor')
+    cursor = db_connection.cursor
+    db_connection.cursor = lambda *args, **kwargs: QueryCountingCursor(cursor(*args, **kwargs), counter)
+    try:
+        yield counter
+    finally:
+        if outer_cursor is None:
+            del db_connection.cursor
+        else:
+            db_connection.cursor = outer_cursor
+
+
+def force_metric_part(value):
+    return value and ''.join(char if char.isalnum() or char in '-_' else '_' for char in value) or 'none'
+
+
+_sink = None
+
+
+def get_sink():
+    global _sink
+
+    if _sink is None and config.INSTRUMENTATION_SINK:
+        _sink = str_to_class(config.INSTRUMENTATION_SINK)()
+    return _sink
+
+
+def get_instrumentation(request):
+    if request is None or get_sink() is None:
+        return None
+
+    if not hasattr(request, '_instrumentation'):
+        request._instrumentation = Instrumentation(request)
+    return request._instrumentation
+
+
+def set_instrumentation_names(request, core, pattern):
+    instrumentation = get_instrumentation(request)
+    if instrumentation is not None:
+        instrumentation.core_name = core.get_menu_group_pattern_name()
+        instrumentation.pattern_name = pattern and pattern.name or None
+
+
+@contextmanager
+def phase(request, name):
+    """
+    Measures wall time and number of DB queries of the code block, it does nothing if no sink is configured.
+    """
+    instrumentation = get_instrumentation(request)
+    if instrumentation is None:
+        yield
+        return
+
+    start = time.time()
+    with count_queries() as counter:
+        try:
+            yield
+        finally:
+            instrumentation.add_phase(name, time.time() - start, counter.queries)
+
+
+def add_remainder_phase(request, name, total_phase_name, phase_name):
+    instrumentation = get_instrumentation(request)
+    if instrumentation is not None:
+        instrumentation.add_remainder_phase(name, total_phase_name, phase_name)
+
+
+def instrumented_phase(name):
+    """
+    Decorator of methods that receive request as the first argument.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            with phase(request, name):
+                return func(self, request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_view(request, name, func, *args, **kwargs):
+    """
+    Calls the view as measured phase, the outermost instrumented view sends measurements of the request to the sink
+    and in DEBUG mode adds Server-Timing header to the response.
+    """
+    instrumentation = get_instrumentation(request)
+    if instrumentation is None:
+        return func(request, *args, **kwargs)
+
+    instrumentation.depth += 1
+    try:
+        with phase(request, name):
+            response = func(request, *args, **kwargs)
+    finally:
+        instrumentation.depth -= 1
+
+    if not instrumentation.depth:
+        get_sink().record(instrumentation)
+        if settings.DEBUG:
+            response['Server-Timing'] = instrumentation.get_server_timing()
+    return response
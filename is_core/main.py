@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import sys
+import types
 
 from django.conf.urls import patterns as django_patterns
 from django.core.urlresolvers import reverse
@@ -8,7 +9,7 @@ from django.shortcuts import get_object_or_404
 from django.utils.translation import ugettext_lazy as _
 from django.utils.datastructures import SortedDict
 from django.http.response import Http404
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ValidationError, ObjectDoesNotExist
 from django.utils import six
 
 from piston.utils import list_to_dict, dict_to_list, join_dicts
@@ -18,11 +19,13 @@ from is_core.actions import WebAction, ConfirmRestAction
 from is_core.generic_views.form_views import AddModelFormView, EditModelFormView
 from is_core.generic_views.table_views import TableView
 from is_core.rest.resource import RestModelResource
-from is_core.auth.main import PermissionsMixin, PermissionsUIMixin, PermissionsRestMixin
+from is_core.auth.main import (PermissionsMixin, PermissionsUIMixin, PermissionsRestMixin, cached_permission,
+                               is_permission_method_name, get_permission_type, permission_method_names)
 from is_core.patterns import UIPattern, RestPattern
-from is_core.utils import flatten_fieldsets, str_to_class, get_new_class_name
+from is_core.utils import flatten_fieldsets, str_to_class, get_new_class_name, is_overridden, flatten_fields_dict
 from is_core import config
 from is_core.menu import LinkMenuItem
+from is_core.utils.models import get_request_obj
 from is_core.loading import register_core
 
 
@@ -32,6 +35,11 @@ class ISCoreBase(type):
 
         abstract = attrs.pop('abstract', False)
 
+        # Permissions of the mixins overridden in cores are cached during request
+        for attr_name, attr in attrs.items():
+            if attr_name in permission_method_names and isinstance(attr, types.FunctionType):
+                attrs[attr_name] = cached_permission(attr)
+
         super_new = super(ISCoreBase, cls).__new__
         new_class = super_new(cls, *args, **kwargs)
         model_module = sys.modules[new_class.__module__]
@@ -132,6 +140,13 @@ class ModelISCore(PermissionsMixin, ISCore):
     def post_save_model(self, request, obj, form, change):
         pass
 
+    def has_save_model_hooks(self):
+        """
+        Returns True if saving of the objects is customized, objects cannot be saved with one bulk_create.
+        """
+        return any(is_overridden(self, ModelISCore, method_name)
+                   for method_name in ('pre_save_model', 'save_model', 'post_save_model'))
+
     def pre_delete_model(self, request, obj):
         pass
 
@@ -141,6 +156,25 @@ class ModelISCore(PermissionsMixin, ISCore):
     def post_delete_model(self, request, obj):
         pass
 
+    def has_delete_model_hooks(self):
+        """
+        Returns True if deleting of the objects is customized, objects cannot be deleted with one query.
+        """
+        return any(is_overridden(self, ModelISCore, method_name)
+                   for method_name in ('pre_delete_model', 'delete_model', 'post_delete_model'))
+
+    def has_object_permissions(self, *permission_types):
+        """
+        Returns True if permissions of given types (e.g. 'read', 'delete', all types if no type is given) can depend
+        on the object. Otherwise permission of one object is valid for all objects and list pages check it only once.
+        """
+        for klass in (PermissionsMixin, PermissionsUIMixin, PermissionsRestMixin):
+            if isinstance(self, klass) and any(is_overridden(self, klass, name) for name in klass.__dict__
+                                               if is_permission_method_name(name) and
+                                               (not permission_types or get_permission_type(name) in permission_types)):
+                return True
+        return False
+
     def verbose_name(self):
         return self.model._meta.verbose_name
     verbose_name = property(verbose_name)
@@ -155,8 +189,11 @@ class ModelISCore(PermissionsMixin, ISCore):
 
     def get_obj(self, request, **filters):
         try:
+            if list(filters.keys()) == ['pk']:
+                # Object loaded by permission check is used
+                return get_request_obj(request, self.get_queryset(request), filters['pk'])
             return get_object_or_404(self.get_queryset(request), **filters)
-        except (ValidationError, ValueError):
+        except (ValidationError, ValueError, ObjectDoesNotExist):
             raise Http404
 
     def get_ordering(self):
@@ -168,6 +205,12 @@ class ModelISCore(PermissionsMixin, ISCore):
     def get_list_actions(self, request, obj):
         return list(self.list_actions)
 
+    def get_list_actions_batch(self, request, objs):
+        """
+        Returns dict of list actions for all objects of one list page (keys are objects primary keys).
+        """
+        return dict((obj.pk, self.get_list_actions(request, obj)) for obj in objs)
+
     def get_default_action(self, request, obj):
         return None
 
@@ -359,9 +402,26 @@ class RestModelISCore(PermissionsRestMixin, ModelISCore):
     def get_rest_default_obj_fields(self):
         return self.rest_default_obj_fields or self.model._rest_meta.default_obj_fields
 
+    def get_rest_export_fields(self, request):
+        """
+        Returns field names of the streamed export, names of related object fields are joined with __.
+        """
+        return [field_name for field_name in flatten_fields_dict(list_to_dict(self.get_rest_default_list_fields()))
+                if not field_name.startswith('_')]
+
     def get_rest_obj_class_names(self, request, obj):
         return list(self.rest_obj_class_names)
 
+    def get_rest_obj_class_names_batch(self, request, objs):
+        """
+        Returns dict of class names for all objects of one list page (keys are objects primary keys).
+        """
+        if not is_overridden(self, RestModelISCore, 'get_rest_obj_class_names'):
+            # Default class names do not depend on the object
+            class_names = self.get_rest_obj_class_names(request, None)
+            return dict((obj.pk, list(class_names)) for obj in objs)
+        return dict((obj.pk, self.get_rest_obj_class_names(request, obj)) for obj in objs)
+
     def get_urls(self):
         return self.get_urlpatterns(self.resource_patterns)
 
@@ -397,14 +457,32 @@ class RestModelISCore(PermissionsRestMixin, ModelISCore):
                                                 self.site_name, r'^/api/?$', self.rest_resource, self, ('GET', 'POST'))
         return resource_patterns
 
+    def _get_delete_list_action(self, obj):
+        confirm_dialog = ConfirmRestAction.ConfirmDialog(_('Do you really want to delete "%s"') %
+                                                         obj)
+        return ConfirmRestAction('api-resource-%s' % self.get_menu_group_pattern_name(),
+                                 _('Delete') , 'DELETE', confirm_dialog=confirm_dialog,
+                                 class_name='delete')
+
     def get_list_actions(self, request, obj):
         list_actions = super(RestModelISCore, self).get_list_actions(request, obj)
         if self.has_delete_permission(request, obj):
-            confirm_dialog = ConfirmRestAction.ConfirmDialog(_('Do you really want to delete "%s"') %
-                                                             obj)
-            list_actions.append(ConfirmRestAction('api-resource-%s' % self.get_menu_group_pattern_name(),
-                                                  _('Delete') , 'DELETE', confirm_dialog=confirm_dialog,
-                                                  class_name='delete'))
+            list_actions.append(self._get_delete_list_action(obj))
+        return list_actions
+
+    def get_list_actions_batch(self, request, objs):
+        if (is_overridden(self, RestModelISCore, 'get_list_actions') or self.has_object_permissions('delete') or
+                not objs):
+            return super(RestModelISCore, self).get_list_actions_batch(request, objs)
+
+        # Delete permission does not depend on the object, it is checked once for the whole page
+        has_delete_permission = self.has_delete_permission(request, objs[0])
+        list_actions = {}
+        for obj in objs:
+            obj_list_actions = super(RestModelISCore, self).get_list_actions(request, obj)
+            if has_delete_permission:
+                obj_list_actions.append(self._get_delete_list_action(obj))
+            list_actions[obj.pk] = obj_list_actions
         return list_actions
 
     def web_link_patterns(self, request):
@@ -437,6 +515,9 @@ class UIRestModelISCore(RestModelISCore, UIModelISCore):
     def get_rest_form_exclude(self, request, obj=None):
         return self.get_form_readonly_fields(request, obj) + self.get_form_exclude(request, obj)
 
+    def get_rest_export_fields(self, request):
+        return list(self.get_rest_list_fields())
+
     def get_rest_extra_fields(self):
         return ('_web_links', '_default_action')
 
@@ -445,5 +526,13 @@ class UIRestModelISCore(RestModelISCore, UIModelISCore):
         list_actions.append(WebAction('edit-%s' % self.get_menu_group_pattern_name(), _('Edit'), 'edit'))
         return list_actions
 
+    def get_list_actions_batch(self, request, objs):
+        if is_overridden(self, UIRestModelISCore, 'get_list_actions'):
+            return super(UIRestModelISCore, self).get_list_actions_batch(request, objs)
+
+        # Core list actions and edit action do not depend on the object, they are created once for the whole page
+        list_actions = self.get_list_actions(request, None)
+        return dict((obj.pk, list(list_actions)) for obj in objs)
+
     def get_default_action(self, request, obj):
         return 'edit-%s' % self.get_menu_group_pattern_name()
@@ -0,0 +1,111 @@
+from __future__ import unicode_literals
+
+import timeit
+
+from optparse import make_option
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.core.urlresolvers import get_resolver
+from django.db import transaction
+from django.db.models.fields.files import FieldFile
+from django.forms.models import modelform_factory
+from django.test.client import RequestFactory
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Compares create/update requests of the registered REST model resources with generated and cached model form
+    classes. Every iteration calls _create_or_update of the resource with the payload built from the first object
+    of the model, all changes are rolled back.
+    """
+
+    help = 'Benchmark of REST create/update with cached model form classes against modelform_factory'
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', action='store', dest='iterations', type='int', default=100,
+                    help='Number of creates/updates per model'),
+        make_option('--username', action='store', dest='username', default=None,
+                    help='User of the requests (default: the first superuser)'),
+    )
+
+    def _get_user(self, username):
+        users = get_user_model()._default_manager.filter(is_active=True)
+        if username:
+            user = users.filter(**{get_user_model().USERNAME_FIELD: username}).first()
+        else:
+            user = users.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError('User does not exist')
+        return user
+
+    def _get_data(self, request, resource, inst):
+        form_class = resource.generate_form_class(request, inst)
+        form = form_class(initial={'_user': request.user, '_request': request}, instance=inst)
+        data = {}
+        for field in form:
+            value = field.value()
+            if isinstance(value, FieldFile):
+                value = None
+            data[field.name] = value
+        return data
+
+    def _create_or_update(self, resource, request, data, iterations, factory):
+        from is_core.rest import resource as resource_module
+
+        cached_modelform_factory = resource_module.cached_modelform_factory
+        resource_module.cached_modelform_factory = factory
+        try:
+            with transaction.atomic():
+                elapsed = timeit.timeit(lambda: resource._create_or_update(request, data.copy()), number=iterations)
+                raise Rollback
+        except Rollback:
+            return elapsed
+        finally:
+            resource_module.cached_modelform_factory = cached_modelform_factory
+
+    def _benchmark(self, resource, request, data, iterations):
+        """
+        Returns requests per second with modelform_factory and cached form classes or None if data is not valid.
+        """
+        from is_core.rest.resource import DataInvalidException, RestException
+        from is_core.utils.forms import cached_modelform_factory
+
+        try:
+            # Checks data and warms up the form class cache
+            self._create_or_update(resource, request, data, 1, cached_modelform_factory)
+        except (DataInvalidException, RestException):
+            return None
+
+        return (iterations / self._create_or_update(resource, request, data, iterations, modelform_factory),
+                iterations / self._create_or_update(resource, request, data, iterations, cached_modelform_factory))
+
+    def handle(self, *args, **options):
+        from is_core.site import registered_model_cores
+
+        # Import URLconf that registers all cores
+        get_resolver(None).url_patterns
+
+        iterations = options.get('iterations')
+        user = self._get_user(options.get('username'))
+        for model_label, core in sorted(registered_model_cores.items()):
+            resource_class = getattr(core, 'rest_resource', None)
+            inst = core.model._default_manager.first()
+            if resource_class is None or inst is None:
+                continue
+
+            resource = resource_class()
+            request = RequestFactory().post('/')
+            request.user = user
+            data = self._get_data(request, resource, inst)
+            for name, payload in (('create', data), ('update', dict(data, id=inst.pk))):
+                result = self._benchmark(resource, request, payload, iterations)
+                if result is None:
+                    self.stdout.write('%s %s: data is not valid' % (model_label, name))
+                else:
+                    self.stdout.write('%s %s: %.1f/s modelform_factory, %.1f/s cached (%.1fx)' % (
+                        model_label, name, result[0], result[1], result[1] / result[0]
+                    ))
@@ -0,0 +1,50 @@
+from __future__ import unicode_literals
+
+import timeit
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.core.urlresolvers import reverse, get_resolver
+
+
+class Command(BaseCommand):
+    """
+    Compares URL generation of the registered is_core patterns by compiled URL builders with the Django reverse
+    function.
+    """
+
+    help = 'Micro-benchmark of compiled URL builders against the reverse function'
+    option_list = BaseCommand.option_list + (
+        make_option('--iterations', action='store', dest='iterations', type='int', default=10000,
+                    help='Number of URL generations per pattern'),
+    )
+
+    def handle(self, *args, **options):
+        from is_core.patterns import patterns, ViewPattern
+
+        # Import URLconf that registers all patterns
+        get_resolver(None).url_patterns
+
+        iterations = options.get('iterations')
+        total_reverse = total_builder = 0
+        for name, pattern in sorted(patterns.items()):
+            if not isinstance(pattern, ViewPattern) or pattern.url_groups is None \
+                    or set(pattern.url_groups.keys()) - set(('pk',)):
+                continue
+
+            kwargs = 'pk' in pattern.url_groups and {'pk': 1} or {}
+            pattern.compile_url_builder()
+            reverse_time = timeit.timeit(lambda: reverse(pattern.pattern, kwargs=kwargs), number=iterations)
+            builder_time = timeit.timeit(lambda: pattern.get_url_string(None, kwargs=kwargs.copy()),
+                                         number=iterations)
+            total_reverse += reverse_time
+            total_builder += builder_time
+            self.stdout.write('%s: reverse %.4fs, builder %.4fs%s' % (
+                name, reverse_time, builder_time, not pattern._url_builder and ' (not compiled)' or ''
+            ))
+
+        if total_builder:
+            self.stdout.write('Total: reverse %.4fs, builder %.4fs (%.1fx)' % (
+                total_reverse, total_builder, total_reverse / total_builder
+            ))
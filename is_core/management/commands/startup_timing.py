@@ -0,0 +1,65 @@
+from __future__ import unicode_literals
+
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.importlib import import_module
+
+
+class Command(BaseCommand):
+    """
+    Reports time of the is_core startup: import of cores modules and for every core build of URL patterns
+    (pattern and view classes) and wrapping of views (URL patterns with permission wrappers).
+    """
+
+    help = 'Reports time of import, URL patterns build and views wrapping of cores'
+
+    def _timeit(self, func):
+        start = time.time()
+        func()
+        return time.time() - start
+
+    def _build_patterns(self, core):
+        for attr_name in ('ui_patterns', 'resource_patterns'):
+            getattr(core, attr_name, None)
+
+    def handle(self, *args, **options):
+        total_import = 0
+        for app in settings.INSTALLED_APPS:
+            module_name = '%s.cores' % app
+            if module_name in sys.modules:
+                self.stdout.write('%s: already imported' % module_name)
+                continue
+
+            try:
+                import_time = self._timeit(lambda: import_module(module_name))
+            except ImportError:
+                continue
+            total_import += import_time
+            self.stdout.write('%s: import %.4fs' % (module_name, import_time))
+
+        if 'is_core.site' not in sys.modules:
+            # Site instantiates all cores
+            site_time = self._timeit(lambda: import_module('is_core.site'))
+            total_import += site_time
+            self.stdout.write('is_core.site: import %.4fs' % site_time)
+
+        from is_core.site import sites
+
+        total_patterns = total_wrapping = 0
+        for site_name, site in sites.items():
+            for menu_group, core in site._registry.items():
+                patterns_time = self._timeit(lambda: self._build_patterns(core))
+                # Patterns are already built, get_urls only wraps views
+                wrapping_time = self._timeit(core.get_urls)
+                total_patterns += patterns_time
+                total_wrapping += wrapping_time
+                self.stdout.write('%s:%s: patterns %.4fs, views wrapping %.4fs' % (
+                    site_name, menu_group, patterns_time, wrapping_time
+                ))
+
+        self.stdout.write('Total: import %.4fs, patterns %.4fs, views wrapping %.4fs' % (
+            total_import, total_patterns, total_wrapping
+        ))
@@ -1,3 +1,16 @@
+from __future__ import unicode_literals
+
+import copy
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.utils.encoding import force_bytes
+
+from is_core import config
+from is_core.utils import is_overridden
+
 
 class MenuItem(object):
 
@@ -26,6 +39,10 @@ class CollapsibleMenuItem(MenuItem):
         self.url = url
 
 
+# URL/title skeletons of the menu items of the sites, they are built once per process
+menu_skeletons = {}
+
+
 class MenuGenerator(object):
 
     def __init__(self, request, site, active_groups):
@@ -34,21 +51,163 @@ class MenuGenerator(object):
         self.active_groups = active_groups
 
     def get_menu_items(self, items):
-        menu_items = []
         if self.active_groups:
             group = self.active_groups[0]
         else:
             group = None
 
+        if config.MENU_CACHE_TIMEOUT is None:
+            return self._get_menu_items(items, group)
+
+        # Menu is cached without active group, active item is selected during rendering
+        cache_key = self.get_cache_key(items)
+        menu_items = cache.get(cache_key)
+        if menu_items is None:
+            menu_items = self._get_menu_items(items, None)
+            cache.set(cache_key, menu_items, config.MENU_CACHE_TIMEOUT)
+        return self._activate_menu_items(menu_items, group)
+
+    def _activate_menu_items(self, menu_items, group):
+        activated_menu_items = []
+        for menu_item in menu_items:
+            if group is not None and menu_item.group == group and not menu_item.active:
+                menu_item = copy.copy(menu_item)
+                menu_item.active = True
+            activated_menu_items.append(menu_item)
+        return activated_menu_items
+
+    def get_permission_fingerprint(self):
+        """
+        Users with the same fingerprint see the same menu items.
+        """
+        user = self.request.user
+        if not user.is_authenticated():
+            return None
+        if user.is_superuser:
+            # Superuser has all permissions
+            return (True, user.is_staff)
+        return (False, user.is_staff, get_user_permissions_fingerprint(user))
+
+    def get_cache_key(self, items):
+        return 'is_core:menu:%s:%s:%s' % (self.site.name, get_menu_version(self.site.name), hashlib.md5(force_bytes(
+            repr((self.get_permission_fingerprint(), [item for item in items if not isinstance(item, MenuItem)]))
+        )).hexdigest())
+
+    def get_menu_skeleton(self):
+        """
+        Returns menu items of the site cores without permission checks and active group. Cores with customized
+        get_menu_item or menu_url (it can depend on the request) are not part of the skeleton.
+        """
+        from is_core.main import UIISCore
+
+        skeleton = menu_skeletons.get(self.site.name)
+        if skeleton is None:
+            skeleton = {}
+            for key, core in self.site._registry.items():
+                if (isinstance(core, UIISCore) and not is_overridden(core, UIISCore, 'get_menu_item') and
+                        not is_overridden(core, UIISCore, 'menu_url')):
+                    skeleton[key] = LinkMenuItem(core.verbose_name_plural, core.menu_url(None), core.menu_group)
+            menu_skeletons[self.site.name] = skeleton
+        return skeleton
+
+    def _get_menu_item(self, item, group):
+        core = self.site._registry[item]
+        skeleton_menu_item = self.get_menu_skeleton().get(item)
+        if skeleton_menu_item is None:
+            return core.get_menu_item(self.request, group)
+        elif core.get_show_in_menu(self.request):
+            menu_item = copy.copy(skeleton_menu_item)
+            menu_item.active = group == menu_item.group
+            return menu_item
+
+    def _get_menu_items(self, items, group):
+        menu_items = []
         for item in items:
             if isinstance(item, MenuItem):
                 menu_items.append(item)
             else:
-                item = self.site._registry[item]
-                menu_item = item.get_menu_item(self.request, group)
+                menu_item = self._get_menu_item(item, group)
                 if menu_item:
                     menu_items.append(menu_item)
         return menu_items
 
     def get_menu_structure(self):
         return self.site._registry.keys()
+
+
+def _get_version(cache_key):
+    # Initial version is a timestamp, items cached before eviction of the version key are not used again
+    cache.add(cache_key, int(time.time() * 1000), None)
+    return cache.get(cache_key)
+
+
+def _increment_version(cache_key):
+    try:
+        cache.incr(cache_key)
+    except ValueError:
+        # Version does not exist, the next one is a new timestamp
+        pass
+
+
+def _get_menu_version_cache_key(site_name):
+    return 'is_core:menu:version:%s' % site_name
+
+
+def get_menu_version(site_name):
+    return _get_version(_get_menu_version_cache_key(site_name))
+
+
+def invalidate_menu(site_name):
+    """
+    Invalidates cached menus of all users of the site, it should be called when permissions of cores are changed.
+    """
+    _increment_version(_get_menu_version_cache_key(site_name))
+
+
+PERMISSIONS_VERSION_CACHE_KEY = 'is_core:menu:permissions:version'
+
+
+def get_user_permissions_fingerprint(user):
+    """
+    Returns hash of the user permissions. It is cached until permissions, groups or permissions of the users are
+    changed.
+    """
+    connect_invalidate_permissions()
+    cache_key = 'is_core:menu:permissions:%s:%s' % (user.pk, _get_version(PERMISSIONS_VERSION_CACHE_KEY))
+    fingerprint = cache.get(cache_key)
+    if fingerprint is None:
+        fingerprint = hashlib.md5(force_bytes(repr(sorted(user.get_all_permissions())))).hexdigest()
+        cache.set(cache_key, fingerprint, config.MENU_CACHE_TIMEOUT)
+    return fingerprint
+
+
+def invalidate_permissions(sender, action=None, **kwargs):
+    """
+    Cached permission fingerprints of all users are invalidated with every change of permissions.
+    """
+    if action in (None, 'post_add', 'post_remove', 'post_clear'):
+        _increment_version(PERMISSIONS_VERSION_CACHE_KEY)
+
+
+# Signals are connected with the first cached fingerprint, user model is not loaded during import of the module
+invalidate_permissions_connected = False
+
+
+def connect_invalidate_permissions():
+    global invalidate_permissions_connected
+
+    if invalidate_permissions_connected:
+        return
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group, Permission
+
+    for model in (Permission, Group):
+        post_save.connect(invalidate_permissions, sender=model)
+        post_delete.connect(invalidate_permissions, sender=model)
+    m2m_changed.connect(invalidate_permissions, sender=Group.permissions.through)
+    user_model = get_user_model()
+    for field_name in ('groups', 'user_permissions'):
+        if hasattr(user_model, field_name):
+            m2m_changed.connect(invalidate_permissions, sender=getattr(user_model, field_name).through)
+    invalidate_permissions_connected = True
@@ -11,7 +11,8 @@ from is_core.exceptions import HttpRedirectException
 class RequestKwargsMiddleware(object):
 
     def process_request(self, request):
-        request.kwargs = resolve(request.path).kwargs
+        # URL kwargs are available for the following middlewares too, site URLs are resolved by the prefix dispatch
+        request.kwargs = resolve(request.path_info, getattr(request, 'urlconf', None)).kwargs
 
 
 class HttpExceptionsMiddleware(object):
@@ -1,9 +1,14 @@
 from __future__ import unicode_literals
 
 import logging
+import re
+import string
 
-from django.core.urlresolvers import reverse
+from django.core.urlresolvers import reverse, get_script_prefix, NoReverseMatch
 from django.conf.urls import url
+from django.utils.datastructures import SortedDict
+from django.utils.encoding import force_text
+from django.utils.http import urlquote
 
 # from is_core.rest.resource import DynamicRestHandlerResource
 from is_core.utils import get_new_class_name
@@ -46,18 +51,93 @@ class Pattern(object):
 
 class ViewPattern(Pattern):
 
+    named_group_re = re.compile(r'\(\?P<(\w+)>([^()]*)\)')
+
     def __init__(self, name, site_name, url_pattern, core):
         super(ViewPattern, self).__init__(name)
         self.url_pattern = url_pattern
         self.site_name = site_name
         self.core = core
+        self.url_groups = self._get_url_groups(url_pattern)
+        self._url_builder = None
 
     @property
     def pattern(self):
         return '%s:%s' % (self.site_name, self.name)
 
+    def _get_url_groups(self, url_pattern):
+        """
+        Returns compiled regexes of named groups or None if pattern contains unnamed or nested groups.
+        """
+        url_groups = SortedDict()
+        for group_name, group_re in self.named_group_re.findall(url_pattern):
+            url_groups[group_name] = re.compile('^(?:%s)$' % group_re, re.UNICODE)
+
+        if url_pattern.replace('\\(', '').count('(') != len(url_groups):
+            return None
+        return url_groups
+
+    def _get_url_placeholder(self, i, group_re):
+        for placeholder in ('%d' % (1073741824 + i), 'iscoreplaceholder%s' % string.ascii_lowercase[i % 26]):
+            if group_re.match(placeholder):
+                return placeholder
+        return None
+
+    def compile_url_builder(self):
+        """
+        URL is reversed once with placeholder values of the named groups. Later URLs are built by joining
+        of the URL parts with values, patterns that cannot be compiled use reverse function.
+        """
+        self._url_builder = False
+        if self.url_groups is None:
+            return
+
+        placeholders = {}
+        for i, (group_name, group_re) in enumerate(self.url_groups.items()):
+            placeholder = self._get_url_placeholder(i, group_re)
+            if placeholder is None:
+                return
+            placeholders[placeholder] = group_name
+
+        try:
+            url = reverse(self.pattern, kwargs=dict((v, k) for k, v in placeholders.items()))
+        except NoReverseMatch:
+            return
+
+        script_prefix = get_script_prefix()
+        if not url.startswith(script_prefix):
+            return
+
+        url = url[len(script_prefix):]
+        url_parts = []
+        for url_part in placeholders and re.split('(%s)' % '|'.join(placeholders.keys()), url) or (url,):
+            if url_part in placeholders:
+                url_parts.append((True, placeholders[url_part]))
+            elif url_part:
+                url_parts.append((False, url_part))
+
+        if len([group_name for is_group, group_name in url_parts if is_group]) == len(placeholders):
+            self._url_builder = url_parts
+
+    def _build_url(self, kwargs):
+        if self._url_builder is None:
+            self.compile_url_builder()
+
+        if not self._url_builder or set(kwargs.keys()) != set(self.url_groups.keys()):
+            return None
+
+        values = {}
+        for group_name, value in kwargs.items():
+            value = force_text(value)
+            if not self.url_groups[group_name].match(value):
+                return None
+            values[group_name] = urlquote(value)
+
+        return get_script_prefix() + ''.join([is_group and values[url_part] or url_part
+                                              for is_group, url_part in self._url_builder])
+
     def _get_try_kwarg(self, obj):
-        if'(?P<pk>[-\w]+)' in self.url_pattern or '(?P<pk>\d+)' in self.url_pattern:
+        if self.url_groups is not None and 'pk' in self.url_groups or '(?P<pk>' in self.url_pattern:
             return {'pk': obj.pk}
         return {}
 
@@ -65,7 +145,7 @@ class ViewPattern(Pattern):
         kwargs = kwargs or {}
         if obj:
             kwargs.update(self._get_try_kwarg(obj))
-        return reverse(self.pattern, kwargs=kwargs)
+        return self._build_url(kwargs) or reverse(self.pattern, kwargs=kwargs)
 
     def get_view(self):
         raise NotImplemented
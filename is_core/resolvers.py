@@ -0,0 +1,92 @@
+from __future__ import unicode_literals
+
+import threading
+
+from django.core.urlresolvers import RegexURLResolver, ResolverMatch, Resolver404
+
+
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+REGEX_OPTIONAL_QUANTIFIERS = set('*?{')
+
+
+def get_literal_prefix(regex):
+    """
+    Returns text that every path matched by the regex starts with.
+    """
+    if not regex.startswith('^') or '|' in regex:
+        return ''
+
+    literal_prefix = []
+    for char in regex[1:]:
+        if char in REGEX_SPECIAL_CHARS:
+            # Previous char can be missing
+            if char in REGEX_OPTIONAL_QUANTIFIERS and literal_prefix:
+                literal_prefix.pop()
+            break
+        literal_prefix.append(char)
+    return ''.join(literal_prefix)
+
+
+class PrefixDispatchURLResolver(RegexURLResolver):
+    """
+    URL resolver that tries only patterns whose literal prefix corresponds with the first segment of the path,
+    instead of all patterns one by one. Patterns without literal prefix are tried for every path, the order of
+    the tried patterns is the same as the order of url_patterns.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(PrefixDispatchURLResolver, self).__init__(*args, **kwargs)
+        self._segment_patterns = None
+        self._prefix_patterns = None
+        self._dispatch_lock = threading.Lock()
+
+    def _populate_dispatch(self):
+        segment_patterns = {}
+        prefix_patterns = {}
+        for i, pattern in enumerate(self.url_patterns):
+            literal_prefix = get_literal_prefix(pattern.regex.pattern)
+            if '/' in literal_prefix:
+                # Pattern matches only paths with the same first segment
+                segment_patterns.setdefault(literal_prefix.split('/', 1)[0], []).append((i, pattern))
+            else:
+                # Pattern matches paths whose first segment starts with the prefix
+                prefix_patterns.setdefault(literal_prefix, []).append((i, pattern))
+        self._segment_patterns = segment_patterns
+        self._prefix_patterns = prefix_patterns
+
+    def get_candidate_patterns(self, path):
+        if self._prefix_patterns is None:
+            with self._dispatch_lock:
+                if self._prefix_patterns is None:
+                    self._populate_dispatch()
+
+        segment = path.split('/', 1)[0]
+        candidate_patterns = list(self._segment_patterns.get(segment, ()))
+        for i in range(len(segment) + 1):
+            candidate_patterns.extend(self._prefix_patterns.get(segment[:i], ()))
+        return [pattern for i, pattern in sorted(candidate_patterns, key=lambda candidate: candidate[0])]
+
+    def resolve(self, path):
+        tried = []
+        match = self.regex.search(path)
+        if match:
+            new_path = path[match.end():]
+            for pattern in self.get_candidate_patterns(new_path):
+                try:
+                    sub_match = pattern.resolve(new_path)
+                except Resolver404 as e:
+                    sub_tried = e.args[0].get('tried')
+                    if sub_tried is not None:
+                        tried.extend([[pattern] + t for t in sub_tried])
+                    else:
+                        tried.append([pattern])
+                else:
+                    if sub_match:
+                        sub_match_dict = dict(match.groupdict(), **self.default_kwargs)
+                        sub_match_dict.update(sub_match.kwargs)
+                        return ResolverMatch(sub_match.func, sub_match.args, sub_match_dict, sub_match.url_name,
+                                             self.app_name or sub_match.app_name,
+                                             [self.namespace] + sub_match.namespaces)
+                    tried.append([pattern])
+            raise Resolver404({'tried': tried, 'path': new_path})
+        raise Resolver404({'path': path})
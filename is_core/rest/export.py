@@ -0,0 +1,117 @@
+from __future__ import unicode_literals
+
+import csv
+import json
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Manager
+from django.db.models.query import prefetch_related_objects
+from django.utils import six
+from django.utils.encoding import force_text, force_bytes
+
+from is_core.utils.models import get_model_field_value
+
+
+class EchoBuffer(object):
+    """
+    File-like object that returns written value instead of storing it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_queryset_chunks(qs, size):
+    """
+    Yields chunks of the queryset objects loaded with iterator(), it ignores prefetch_related of the queryset,
+    therefore related objects are prefetched for every chunk.
+    """
+    for objs in iter_chunks(qs.iterator(), size):
+        if qs._prefetch_related_lookups:
+            prefetch_related_objects(objs, qs._prefetch_related_lookups)
+        yield objs
+
+
+class Exporter(object):
+    """
+    Serializes pages of objects to lines of the streamed response, only one line is held in memory.
+    """
+
+    content_type = None
+    extension = None
+
+    def __init__(self, field_names):
+        self.field_names = field_names
+
+    def get_value(self, obj, field_name):
+        if field_name == '_obj_name':
+            return force_text(obj)
+
+        try:
+            value = get_model_field_value(field_name, obj)
+        except (AttributeError, ObjectDoesNotExist):
+            return None
+
+        if isinstance(value, Manager):
+            # Related objects (prefetched with the objects) are exported as primary keys
+            return [related_obj.pk for related_obj in value.all()]
+        return isinstance(value, Model) and value.pk or value
+
+    def serialize_obj(self, obj):
+        raise NotImplementedError
+
+    def iter_lines(self, pages):
+        for objs in pages:
+            for obj in objs:
+                yield self.serialize_obj(obj)
+
+
+class CsvExporter(Exporter):
+
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self, field_names):
+        super(CsvExporter, self).__init__(field_names)
+        self.writer = csv.writer(EchoBuffer())
+
+    def _write_row(self, values):
+        # Python 2 csv module does not support unicode
+        return self.writer.writerow([six.PY2 and force_bytes(value) or force_text(value) for value in values])
+
+    def serialize_obj(self, obj):
+        values = [self.get_value(obj, field_name) for field_name in self.field_names]
+        return self._write_row(['' if value is None else value for value in values])
+
+    def iter_lines(self, pages):
+        yield self._write_row(self.field_names)
+        for line in super(CsvExporter, self).iter_lines(pages):
+            yield line
+
+
+class JsonLinesExporter(Exporter):
+
+    content_type = 'application/x-json-stream'
+    extension = 'jsonl'
+
+    def serialize_obj(self, obj):
+        return json.dumps(dict((field_name, self.get_value(obj, field_name)) for field_name in self.field_names),
+                          cls=DjangoJSONEncoder) + '\n'
+
+
+exporters = {
+    CsvExporter.extension: CsvExporter,
+    JsonLinesExporter.extension: JsonLinesExporter,
+}
@@ -1,19 +1,95 @@
 from __future__ import unicode_literals
 
+import base64
+import datetime
+import hashlib
+import json
+import decimal
+import re
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Q
+from django.db.models.sql.datastructures import EmptyResultSet
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.fields.related import RelatedField
+from django.utils import six
+from django.utils.encoding import force_text, force_bytes
 from django.utils.translation import ugettext_lazy as _
 
+from is_core import config
+from is_core.utils import Enum
+
+
+TOTAL = Enum(('EXACT', 'NONE', 'CACHED', 'ESTIMATE'))
+
 
 class Paginator(object):
+    """
+    Offset paginator. Strategy of X-Total computation can be changed with total_strategy:
+        * EXACT - COUNT query is executed with every request
+        * NONE - X-Total is returned only if request contains X-Fields-Total header
+        * CACHED - result of COUNT query is cached according to the filtered query
+        * ESTIMATE - query planner estimate is used for big tables (PostgreSQL only, other databases use COUNT)
+    """
 
-    def __init__(self, qs, request):
+    total_strategy = None
+
+    def __init__(self, qs, request, total_strategy=None):
         self.qs = qs
         self.offset = self._get_offset(request)
         self.base = self._get_base(request)
-        self.total = self._get_total()
+        self.total = self._get_total(request, total_strategy or self.total_strategy or config.REST_PAGINATOR_TOTAL)
+
+    def _get_total(self, request, total_strategy):
+        if total_strategy == TOTAL.NONE:
+            if 'HTTP_X_FIELDS_TOTAL' in request.META:
+                return self._get_exact_total()
+            return None
+        elif total_strategy == TOTAL.CACHED:
+            return self._get_cached_total()
+        elif total_strategy == TOTAL.ESTIMATE:
+            return self._get_estimated_total()
+        else:
+            return self._get_exact_total()
 
-    def _get_total(self):
+    def _get_exact_total(self):
         return self.qs.count()
 
+    def _get_total_sql(self):
+        qs = self.qs.order_by()
+        return qs.query.get_compiler(using=qs.db).as_sql()
+
+    def _get_cached_total(self):
+        try:
+            sql, params = self._get_total_sql()
+        except EmptyResultSet:
+            return 0
+
+        cache_key = 'is_core:rest:total:%s' % hashlib.md5(force_bytes('%s%r' % (sql, params))).hexdigest()
+        total = cache.get(cache_key)
+        if total is None:
+            total = self._get_exact_total()
+            cache.set(cache_key, total, config.REST_PAGINATOR_TOTAL_CACHE_TIMEOUT)
+        return total
+
+    def _get_estimated_total(self):
+        connection = connections[self.qs.db]
+        if connection.vendor != 'postgresql':
+            return self._get_exact_total()
+
+        try:
+            sql, params = self._get_total_sql()
+        except EmptyResultSet:
+            return 0
+
+        cursor = connection.cursor()
+        cursor.execute('EXPLAIN %s' % sql, params)
+        match = re.search(r'rows=(\d+)', cursor.fetchone()[0])
+        if not match or int(match.group(1)) < config.REST_PAGINATOR_TOTAL_ESTIMATE_THRESHOLD:
+            return self._get_exact_total()
+        return int(match.group(1))
+
     def _get_offset(self, request):
         from is_core.rest.resource import RestException
 
@@ -40,3 +116,189 @@ class Paginator(object):
             return self.qs[self.offset:(self.offset + self.base)]
         else:
             return self.qs[self.offset:]
+
+    def get_http_headers(self):
+        if self.total is None:
+            return {}
+        return {'X-Total': self.total}
+
+
+class CursorPaginator(Paginator):
+    """
+    Keyset paginator. The X-Cursor header contains values of the ordering fields of the last object of
+    the previous page, therefore the next page is selected with WHERE condition instead of OFFSET and its cost
+    does not depend on the page position. Empty X-Cursor header returns the first page. Ordering by nullable fields
+    is not supported.
+    """
+
+    default_base = 20
+    total_strategy = TOTAL.NONE
+
+    def __init__(self, qs, request, total_strategy=None):
+        from is_core.rest.resource import RestException
+
+        self.ordering = self._get_ordering(qs)
+        self.qs = qs.order_by(*[self._get_order_term(field, desc) for field, desc in self.ordering])
+        if self.has_nullable_ordering():
+            # Seek filter would skip objects with empty values of the ordering fields
+            raise RestException(_('Cursor pagination cannot be used with ordering by nullable fields'))
+        self.base = self._get_base(request) or self.default_base
+        self.cursor = self._get_cursor(request)
+        self.total = self._get_total(request, total_strategy or self.total_strategy)
+
+    def _normalize_field(self, model, field_name):
+        if field_name == 'pk':
+            return field_name
+
+        try:
+            field = model._meta.get_field(field_name.split('__', 1)[0])
+        except FieldDoesNotExist:
+            return field_name
+
+        if '__' in field_name:
+            if isinstance(field, RelatedField):
+                current_field_name, next_field_name = field_name.split('__', 1)
+                return '__'.join((current_field_name, self._normalize_field(field.rel.to, next_field_name)))
+            return field_name
+        elif isinstance(field, RelatedField):
+            # Ordering by relation uses ordering of the related model, cursor needs its primary key
+            return '%s__pk' % field_name
+        elif field.primary_key:
+            return 'pk'
+        return field_name
+
+    def _get_ordering(self, qs):
+        from is_core.rest.resource import RestException
+
+        ordering = []
+        ordering_fields = []
+        for order_field in (qs.query.order_by or qs.model._meta.ordering):
+            if not isinstance(order_field, six.string_types) or order_field == '?':
+                raise RestException(_('Cursor pagination cannot be used with this ordering'))
+            field_name = self._normalize_field(qs.model, order_field.lstrip('-'))
+            if field_name not in ordering_fields:
+                ordering.append((field_name, order_field.startswith('-')))
+                ordering_fields.append(field_name)
+
+        # Primary key makes ordering unambiguous
+        if 'pk' not in ordering_fields:
+            ordering.append(('pk', ordering and ordering[-1][1] or False))
+        return ordering
+
+    def _is_nullable_field(self, model, field_name):
+        if field_name == 'pk':
+            return False
+
+        try:
+            field = model._meta.get_field(field_name.split('__', 1)[0])
+        except FieldDoesNotExist:
+            # Values of other fields are unknown
+            return True
+
+        if field.null:
+            return True
+        elif '__' in field_name and isinstance(field, RelatedField):
+            return self._is_nullable_field(field.rel.to, field_name.split('__', 1)[1])
+        return '__' in field_name
+
+    def has_nullable_ordering(self):
+        """
+        Returns True if ordering fields can contain empty values, objects cannot be paginated with seek filter.
+        """
+        return any(self._is_nullable_field(self.qs.model, field) for field in self._get_ordering_fields())
+
+    def _get_order_term(self, field, desc):
+        return desc and '-%s' % field or field
+
+    def _get_ordering_fields(self):
+        return [field for field, desc in self.ordering]
+
+    def _encode_value(self, value):
+        from is_core.rest.resource import RestException
+
+        if value is None:
+            raise RestException(_('Cursor pagination cannot be used with ordering by empty values'))
+        elif isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        elif isinstance(value, decimal.Decimal):
+            return force_text(value)
+        return value
+
+    def encode_cursor(self, values):
+        data = {'fields': self._get_ordering_fields(), 'values': [self._encode_value(value) for value in values]}
+        return force_text(base64.urlsafe_b64encode(force_bytes(json.dumps(data))))
+
+    def decode_cursor(self, cursor):
+        from is_core.rest.resource import RestException
+
+        try:
+            data = json.loads(force_text(base64.urlsafe_b64decode(force_bytes(cursor))))
+            fields, values = data['fields'], data['values']
+        except (TypeError, ValueError, KeyError):
+            raise RestException(_('X-Cursor is not valid'))
+
+        if fields != self._get_ordering_fields() or len(values) != len(fields):
+            raise RestException(_('X-Cursor does not correspond with the current ordering'))
+        return values
+
+    def _get_cursor(self, request):
+        cursor = request.META.get('HTTP_X_CURSOR', '').strip()
+        if not cursor:
+            return None
+        return self.decode_cursor(cursor)
+
+    def _get_seek_filter(self, values):
+        seek_filter = None
+        for i, (field, desc) in enumerate(self.ordering):
+            term = Q(**{'%s__%s' % (field, desc and 'lt' or 'gt'): values[i]})
+            for prev_field, prev_value in zip(self._get_ordering_fields()[:i], values[:i]):
+                term &= Q(**{prev_field: prev_value})
+            if seek_filter is None:
+                seek_filter = term
+            else:
+                seek_filter |= term
+        return seek_filter
+
+    def _get_seek_qs(self, cursor):
+        if cursor is None:
+            return self.qs
+        return self.qs.filter(self._get_seek_filter(cursor))
+
+    @property
+    def seek_qs(self):
+        return self._get_seek_qs(self.cursor)
+
+    def iter_pages(self, base=None):
+        """
+        Yields lists of objects of all pages from the cursor, every page is loaded with one query and only one page
+        is held in memory.
+        """
+        base = base or self.base
+        cursor = self.cursor
+        while True:
+            seek_qs = self._get_seek_qs(cursor)
+            objs = list(seek_qs[:base])
+            if objs:
+                yield objs
+            if len(objs) < base:
+                return
+            cursor = list(seek_qs.values_list(*self._get_ordering_fields())[base - 1])
+
+    @property
+    def page_qs(self):
+        return self.seek_qs[:self.base]
+
+    @property
+    def next_cursor(self):
+        # Ordering values of the last object of the page and the first object of the next page
+        values = list(self.seek_qs.values_list(*self._get_ordering_fields())[self.base - 1:self.base + 1])
+        if len(values) < 2:
+            return None
+        return self.encode_cursor(values[0])
+
+    def get_http_headers(self):
+        http_headers = super(CursorPaginator, self).get_http_headers()
+        next_cursor = self.next_cursor
+        if next_cursor:
+            http_headers['X-Next-Cursor'] = next_cursor
+        return http_headers
@@ -0,0 +1,102 @@
+from __future__ import unicode_literals
+
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.query import prefetch_related_objects
+from django.db.models.fields.related import (ReverseSingleRelatedObjectDescriptor, SingleRelatedObjectDescriptor,
+                                             ForeignRelatedObjectsDescriptor, ManyRelatedObjectsDescriptor,
+                                             ReverseManyRelatedObjectsDescriptor)
+
+from piston.utils import list_to_dict
+
+
+# Query plans of the serialized fields, key is (model, fields, only_fields)
+query_plans = {}
+# Fields are requested by clients, number of stored plans is limited
+MAX_QUERY_PLANS = 1000
+
+
+class QueryPlan(object):
+    """
+    Related objects loading of the serialized fields. Foreign keys and one to one relations are joined with
+    select_related, many to many and reverse foreign key relations are loaded with prefetch_related. If only_fields
+    is True, columns of the model that are not serialized are deferred with only().
+    """
+
+    def __init__(self, model, fields, only_fields=False):
+        self.model = model
+        self.select_related = []
+        self.prefetch_related = []
+        self.only = only_fields and ['pk'] or None
+        self._plan_fields(model, list_to_dict(fields), '', False)
+
+    def _get_related_model(self, descriptor):
+        if isinstance(descriptor, (ReverseSingleRelatedObjectDescriptor, ReverseManyRelatedObjectsDescriptor)):
+            return descriptor.field.rel.to
+        return descriptor.related.model
+
+    def _plan_fields(self, model, fields, prefix, is_prefetched):
+        for field_name, subfields in fields.items():
+            descriptor = getattr(model, field_name, None)
+            path = prefix + field_name
+
+            if isinstance(descriptor, (ReverseSingleRelatedObjectDescriptor, SingleRelatedObjectDescriptor)):
+                # Relations inside prefetched objects are prefetched too
+                if is_prefetched:
+                    self.prefetch_related.append(path)
+                else:
+                    self.select_related.append(path)
+                if isinstance(descriptor, ReverseSingleRelatedObjectDescriptor):
+                    self._plan_only_field(model, prefix, field_name)
+            elif isinstance(descriptor, (ForeignRelatedObjectsDescriptor, ManyRelatedObjectsDescriptor,
+                                         ReverseManyRelatedObjectsDescriptor)):
+                self.prefetch_related.append(path)
+            else:
+                self._plan_only_field(model, prefix, field_name)
+                continue
+
+            if subfields:
+                self._plan_fields(self._get_related_model(descriptor), subfields, path + '__',
+                                  is_prefetched or path in self.prefetch_related)
+
+    def _plan_only_field(self, model, prefix, field_name):
+        # Only columns of the queryset model are deferred
+        if self.only is None or prefix:
+            return
+
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            # Methods and properties of the model can use any field, other fields are methods of the resource
+            if hasattr(model, field_name):
+                self.only = None
+        else:
+            self.only.append(field.name)
+
+    def apply_obj(self, obj):
+        """
+        Loads related objects of the already loaded object, joined relations are prefetched too.
+        """
+        lookups = self.select_related + self.prefetch_related
+        if lookups:
+            prefetch_related_objects([obj], lookups)
+        return obj
+
+    def apply(self, qs):
+        if self.select_related:
+            qs = qs.select_related(*self.select_related)
+        if self.prefetch_related:
+            qs = qs.prefetch_related(*self.prefetch_related)
+        if self.only is not None:
+            qs = qs.only(*self.only)
+        return qs
+
+
+def get_query_plan(model, fields, only_fields=False):
+    key = (model, frozenset(fields), only_fields)
+    try:
+        return query_plans[key]
+    except KeyError:
+        query_plan = QueryPlan(model, fields, only_fields)
+        if len(query_plans) < MAX_QUERY_PLANS:
+            query_plans[key] = query_plan
+        return query_plan
@@ -1,21 +1,37 @@
 from __future__ import unicode_literals
 
 import re
+import calendar
+import datetime
+import hashlib
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.forms.models import modelform_factory
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.utils.encoding import force_text, force_bytes
+from django.utils.http import quote_etag, parse_etags, http_date, parse_http_date_safe
 from django.utils.translation import ugettext_lazy as _
 from django.db.models.fields.related import ForeignRelatedObjectsDescriptor
-from django.db import transaction
+from django.db import transaction, connections
+from django.db.models import Model
+from django.db.models.deletion import Collector
+from django.db.models.signals import pre_save, post_save
 from django.db.utils import InterfaceError, DatabaseError
+from django.http.response import StreamingHttpResponse, HttpResponseNotModified
 
 from piston.resource import BaseResource, BaseModelResource
 from piston.utils import get_resource_of_model, rc, HeadersResult
 
-from is_core.utils.models import get_model_field_names
-from is_core.rest.paginator import Paginator
+from is_core.utils import is_overridden
+from is_core.utils.models import (get_model_field_names, get_request_obj, remove_request_obj,
+                                  remove_request_model_objs)
+from is_core.utils.forms import cached_modelform_factory
+from is_core.rest.paginator import Paginator, CursorPaginator
+from is_core.rest.planner import get_query_plan
+from is_core.rest.export import exporters, iter_queryset_chunks, JsonLinesExporter
 from is_core.filters import get_model_field_or_method_filter
 from is_core.filters.exceptions import FilterException
+from is_core.auth.main import clear_permission_cache, http_method_permission_types
+from is_core.instrumentation import phase, instrumented_phase, add_remainder_phase, set_instrumentation_names
+from is_core import config
 
 
 class RestResponse(HeadersResult):
@@ -96,10 +112,13 @@ class DataPreprocessor(DataProcessor):
         errors = []
 
         data[key] = []
+        # Existing objects are loaded with one query
+        insts = resource._get_instances(self.request, [data_item for data_item in data_items
+                                                       if isinstance(data_item, dict)])
         for data_item in data_items:
             if isinstance(data_item, dict):
                 try:
-                    data[key].append(resource._create_or_update(self.request, data_item).pk)
+                    data[key].append(resource._create_or_update(self.request, data_item, insts=insts).pk)
                 except (DataInvalidException, ResourceNotFoundException) as ex:
                     er = ex.errors
                     er.update({'_index': i})
@@ -145,14 +164,14 @@ class DataPostprocessor(DataProcessor):
         i = 1
         errors = []
         existing_related = []
-        for rel_obj_data in data_item:
-
-            if not isinstance(rel_obj_data, dict):
-                rel_obj_data = {'id': rel_obj_data}
-
+        rel_objs_data = [isinstance(rel_obj_data, dict) and rel_obj_data or {'id': rel_obj_data}
+                         for rel_obj_data in data_item]
+        # Existing objects are loaded with one query
+        insts = resource._get_instances(self.request, rel_objs_data)
+        for rel_obj_data in rel_objs_data:
             rel_obj_data[related_obj.field.name] = self.inst.pk
             try:
-                existing_related.append(resource._create_or_update(self.request, rel_obj_data).pk)
+                existing_related.append(resource._create_or_update(self.request, rel_obj_data, insts=insts).pk)
             except (DataInvalidException, ResourceNotFoundException) as ex:
                 er = ex.errors
                 er.update({'_index': i})
@@ -160,14 +179,33 @@ class DataPostprocessor(DataProcessor):
             i += 1
 
         # TODO: Delete other related objects. This will be more complicated.
-        for reverse_related_obj in resource.model.objects.filter(**{related_obj.field.name: self.inst})\
-                                    .exclude(pk__in=existing_related):
-            if resource.has_delete_permission(self.request, reverse_related_obj):
+        deleted_objs = [reverse_related_obj for reverse_related_obj in
+                        resource.model.objects.filter(**{related_obj.field.name: self.inst})
+                        .exclude(pk__in=existing_related)
+                        if resource.has_delete_permission(self.request, reverse_related_obj)]
+        if deleted_objs and not resource.core.has_delete_model_hooks():
+            self._bulk_delete(resource.model.objects.filter(pk__in=[obj.pk for obj in deleted_objs]))
+        else:
+            for reverse_related_obj in deleted_objs:
                 resource._delete(self.request, reverse_related_obj)
 
         if errors:
             self.errors[key] = errors
 
+    def _bulk_delete(self, qs):
+        """
+        Deletes objects of the queryset with its cascade, deleted objects are removed from the request identity map.
+        """
+        collector = Collector(using=qs.db)
+        collector.collect(qs)
+        for model, instances in collector.data.items():
+            for instance in instances:
+                remove_request_obj(self.request, instance)
+        for fast_delete_qs in collector.fast_deletes:
+            remove_request_model_objs(self.request, fast_delete_qs.model)
+        collector.delete()
+        clear_permission_cache(self.request)
+
     def _process_field(self, data, key, data_item):
         if key not in self.form_fields.keys() and hasattr(self.model, key) and \
             isinstance(getattr(self.model, key), ForeignRelatedObjectsDescriptor):
@@ -179,13 +217,79 @@ class DataPostprocessor(DataProcessor):
                 self._process_list_field(resource, data, key, data_item, related_obj)
 
 
+class ListBatch(object):
+    """
+    Values of the object fields computed together for all objects of one list page. Actions and class names are
+    obtained from the core batch methods that can be overridden to check permissions of all objects together.
+    """
+
+    def __init__(self, resource_class, request, objs):
+        self.resource_class = resource_class
+        self.core = resource_class.core
+        self.request = request
+        self.objs = objs
+        self.pks = set(obj.pk for obj in objs)
+        self._actions = None
+        self._class_names = None
+        self._allowed_methods = {}
+        self._has_object_permissions = {}
+        self._web_link_patterns = None
+
+    def contains(self, obj):
+        return isinstance(obj, self.resource_class.model) and obj.pk in self.pks
+
+    def _pattern_has_object_permissions(self, pattern):
+        """
+        Only permissions checked by the methods of the pattern are relevant, unknown methods can check any of them.
+        """
+        if pattern.name not in self._has_object_permissions:
+            permission_types = set(http_method_permission_types.get(method) for method in pattern.methods or ())
+            if None in permission_types:
+                permission_types = set(http_method_permission_types.values())
+            self._has_object_permissions[pattern.name] = self.core.has_object_permissions(*permission_types) or any(
+                is_overridden(pattern.resource, RestCoreResourceMixin, 'has_%s_permission' % permission_type)
+                for permission_type in permission_types
+            )
+        return self._has_object_permissions[pattern.name]
+
+    def get_allowed_methods(self, pattern, obj):
+        if self._pattern_has_object_permissions(pattern):
+            return pattern.get_allowed_methods(self.request, obj)
+
+        # Allowed methods do not depend on the object, they are computed once for the whole page
+        if pattern.name not in self._allowed_methods:
+            self._allowed_methods[pattern.name] = pattern.get_allowed_methods(self.request, obj)
+        return list(self._allowed_methods[pattern.name])
+
+    def get_web_link_patterns(self):
+        # Patterns of web links do not depend on the object, they are obtained once for the whole page
+        if self._web_link_patterns is None:
+            self._web_link_patterns = list(self.core.web_link_patterns(self.request))
+        return self._web_link_patterns
+
+    def get_actions(self, obj):
+        if self._actions is None:
+            self._actions = self.core.get_list_actions_batch(self.request, self.objs)
+        return self._actions.get(obj.pk)
+
+    def get_class_names(self, obj):
+        if self._class_names is None:
+            self._class_names = self.core.get_rest_obj_class_names_batch(self.request, self.objs)
+        return self._class_names.get(obj.pk)
+
+
 class RestResource(BaseResource):
     login_required = True
 
     def dispatch(self, request, *args, **kwargs):
         if hasattr(self, 'core'):
             self.core.init_rest_request(request)
-        return super(RestResource, self).dispatch(request, *args, **kwargs)
+            set_instrumentation_names(request, self.core, getattr(self, 'pattern', None))
+        with phase(request, 'rest'):
+            response = super(RestResource, self).dispatch(request, *args, **kwargs)
+        # Handler methods are measured, the rest of the dispatch is serialization of the result
+        add_remainder_phase(request, 'serialization', 'rest', 'handler')
+        return response
 
     @classmethod
     def __init_core__(cls, core, pattern):
@@ -232,11 +336,36 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
     default_list_fields = ('_rest_links',)
     register = False
     form_class = None
+    # Strategy of X-Total computation, None means config.REST_PAGINATOR_TOTAL
+    total_strategy = None
+    # Columns that are not serialized are deferred, model methods in fields turn it off
+    only_serialized_fields = False
+    # Field that changes with every change of the object (e.g. updated_at), it is used for ETag and Last-Modified
+    version_field = None
+    # Headers that change list response
+    etag_list_headers = ('HTTP_X_ORDER', 'HTTP_X_DIRECTION', 'HTTP_X_OFFSET', 'HTTP_X_BASE', 'HTTP_X_CURSOR',
+                         'HTTP_X_FIELDS_TOTAL')
+    # Headers that change representation of the objects (serialized fields, format, language)
+    etag_representation_headers = ('HTTP_X_FIELDS', 'HTTP_ACCEPT', 'HTTP_ACCEPT_LANGUAGE')
+
+    @classmethod
+    def _get_list_batch(cls, request, obj):
+        list_batch = getattr(request, '_list_batches', {}).get(cls)
+        if list_batch and list_batch.contains(obj):
+            return list_batch
+        return None
+
+    @classmethod
+    def _init_list_batch(cls, request, objs):
+        if not hasattr(request, '_list_batches'):
+            request._list_batches = {}
+        request._list_batches[cls] = ListBatch(cls, request, objs)
 
     @classmethod
     def _web_links(cls, obj, request):
+        list_batch = cls._get_list_batch(request, obj)
         web_links = {}
-        for pattern in cls.core.web_link_patterns(request):
+        for pattern in (list_batch.get_web_link_patterns() if list_batch else cls.core.web_link_patterns(request)):
             url = pattern.get_url_string(request, obj=obj)
             if url:
                 web_links[pattern.name] = url
@@ -244,11 +373,16 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
     @classmethod
     def _rest_links(cls, obj, request):
+        list_batch = cls._get_list_batch(request, obj)
         rest_links = {}
         for pattern in cls.core.resource_patterns.values():
             url = pattern.get_url_string(request, obj=obj)
             if url:
-                rest_links[pattern.name] = {'url': url, 'methods': pattern.get_allowed_methods(request, obj)}
+                if list_batch:
+                    methods = list_batch.get_allowed_methods(pattern, obj)
+                else:
+                    methods = pattern.get_allowed_methods(request, obj)
+                rest_links[pattern.name] = {'url': url, 'methods': methods}
         return rest_links
 
     @classmethod
@@ -257,18 +391,25 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
     @classmethod
     def _actions(cls, obj, request):
-        ac = cls.core.get_list_actions(request, obj)
-        return ac
+        list_batch = cls._get_list_batch(request, obj)
+        if list_batch:
+            return list_batch.get_actions(obj)
+        return cls.core.get_list_actions(request, obj)
 
     @classmethod
     def _class_names(cls, obj, request):
+        list_batch = cls._get_list_batch(request, obj)
+        if list_batch:
+            return list_batch.get_class_names(obj)
         return cls.core.get_rest_obj_class_names(request, obj)
 
     def get_queryset(self, request):
         return self.core.get_queryset(request)
 
+    @instrumented_phase('filters')
     def _filter_queryset(self, request, qs):
         filter_terms = request.GET.dict()
+        filter_terms.pop('_export', None)
         for filter_temr, filter_val in filter_terms.items():
             filter = get_model_field_or_method_filter(filter_temr, self.model, filter_val)
             qs = filter.filter_queryset(qs, request)
@@ -290,19 +431,148 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
         else:
             raise RestException(_('Cannot resolve X-Order value "%s" into field') % order_field)
 
+    def _get_requested_fields(self, request, default_fields):
+        """
+        Returns default fields together with allowed fields requested with X-Fields header.
+        """
+        if not request.META.get('HTTP_X_FIELDS'):
+            return default_fields
+
+        allowed_field_names = set(field.split('__', 1)[0] for field in self.fields)
+        requested_fields = [field.strip() for field in request.META['HTTP_X_FIELDS'].split(',')]
+        return set(default_fields) | set(field for field in requested_fields
+                                         if field and field.split('__', 1)[0] in allowed_field_names)
+
+    def _get_query_plan(self, request, fields):
+        return get_query_plan(self.model, self._get_requested_fields(request, fields), self.only_serialized_fields)
+
+    def _plan_queryset(self, request, qs, fields):
+        # Related objects of serialized fields are loaded together with the objects
+        return self._get_query_plan(request, fields).apply(qs)
+
+    def _get_planned_obj(self, request, qs, pk):
+        # Object is shared with permission checks, related objects of serialized fields are loaded after the lookup
+        return self._get_query_plan(request, self.default_obj_fields).apply_obj(get_request_obj(request, qs, pk))
+
+    @instrumented_phase('pagination')
+    def _get_paginator(self, request, qs):
+        if 'HTTP_X_CURSOR' in request.META:
+            return CursorPaginator(qs, request)
+        return Paginator(qs, request, self.total_strategy)
+
+    def _get_export_format(self, request):
+        """
+        Export is requested with GET parameter _export (csv or jsonl, other values mean jsonl) or Accept header.
+        """
+        if '_export' in request.GET:
+            return request.GET['_export'] in exporters and request.GET['_export'] or JsonLinesExporter.extension
+
+        accept = request.META.get('HTTP_ACCEPT', '')
+        for exporter_class in exporters.values():
+            if exporter_class.content_type in accept:
+                return exporter_class.extension
+        return None
+
+    def _export(self, request, qs, export_format):
+        """
+        Streams all objects of the queryset, objects are loaded in chunks with keyset pagination. Queryset with
+        ordering that cannot be used for keyset pagination (e.g. nullable fields) is iterated with iterator().
+        """
+        try:
+            paginator = CursorPaginator(qs, request)
+        except RestException:
+            paginator = None
+
+        if paginator is None:
+            pages = iter_queryset_chunks(qs, config.REST_EXPORT_CHUNK_SIZE)
+        else:
+            pages = paginator.iter_pages(config.REST_EXPORT_CHUNK_SIZE)
+
+        exporter = exporters[export_format](self.core.get_rest_export_fields(request))
+        response = StreamingHttpResponse(exporter.iter_lines(pages), content_type=exporter.content_type)
+        response['Content-Disposition'] = 'attachment; filename="%s.%s"' % (self.model._meta.model_name,
+                                                                           exporter.extension)
+        return response
+
+    def _get_etag(self, request, values):
+        # Response contains actions and links that depend on the user, representation depends on the request
+        representation = (request.GET.urlencode(),
+                          [request.META.get(header) for header in self.etag_representation_headers])
+        return hashlib.md5(force_bytes(repr((request.user.pk, representation, values)))).hexdigest()
+
+    def _get_last_modified(self, version):
+        if isinstance(version, datetime.datetime):
+            return calendar.timegm(version.utctimetuple())
+        return None
+
+    def _is_not_modified(self, request, etag, last_modified=None):
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            return etag in parse_etags(if_none_match)
+
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE'))
+        return bool(if_modified_since and last_modified and last_modified <= if_modified_since)
+
+    def _get_not_modified_response(self, http_headers):
+        response = HttpResponseNotModified()
+        for header, value in http_headers.items():
+            response[header] = value
+        return response
+
+    def _get_conditional_headers(self, etag, last_modified=None):
+        http_headers = {'ETag': quote_etag(etag)}
+        if last_modified:
+            http_headers['Last-Modified'] = http_date(last_modified)
+        return http_headers
+
+    def _read_obj(self, request, qs, pk):
+        if not self.version_field:
+            return self._get_planned_obj(request, qs, pk)
+
+        # Only version of the object is loaded if the object was not modified
+        version = qs.filter(pk=pk).values_list(self.version_field, flat=True).get()
+        etag = self._get_etag(request, (pk, version))
+        last_modified = self._get_last_modified(version)
+        http_headers = self._get_conditional_headers(etag, last_modified)
+        if self._is_not_modified(request, etag, last_modified):
+            return self._get_not_modified_response(http_headers)
+        return HeadersResult(self._get_planned_obj(request, qs, pk), http_headers)
+
+    def _get_list_etag(self, request, page_qs, http_headers):
+        versions = list(page_qs.values_list('pk', self.version_field))
+        request_headers = [request.META.get(header) for header in self.etag_list_headers]
+        return self._get_etag(request, (request_headers, sorted(http_headers.items()), versions))
+
+    @instrumented_phase('handler')
     def read(self, request, pk=None, **kwargs):
         qs = self.get_queryset(request)
         if pk:
             try:
-                return qs.get(pk=pk)
+                return self._read_obj(request, qs, pk)
             except ObjectDoesNotExist:
                 return rc.NOT_FOUND
 
         try:
             qs = self._filter_queryset(request, qs)
             qs = self._order_queryset(request, qs)
-            paginator = Paginator(qs, request)
-            return HeadersResult(paginator.page_qs, {'X-Total': paginator.total})
+            qs = self._plan_queryset(request, qs, self.default_list_fields)
+            export_format = self._get_export_format(request)
+            if export_format:
+                return self._export(request, qs, export_format)
+
+            paginator = self._get_paginator(request, qs)
+            page_qs = paginator.page_qs
+            http_headers = paginator.get_http_headers()
+            if self.version_field:
+                # Only primary keys and versions of the page objects are loaded if the page was not modified
+                etag = self._get_list_etag(request, page_qs, http_headers)
+                http_headers.update(self._get_conditional_headers(etag))
+                if self._is_not_modified(request, etag):
+                    return self._get_not_modified_response(self._get_conditional_headers(etag))
+
+            # Queryset is evaluated here and its result cache is used during serialization
+            self._init_list_batch(request, list(page_qs))
+            return HeadersResult(page_qs, http_headers)
         except RestException as ex:
             return RestErrorResponse(ex.errors)
         # Filter exceptions returns empty list
@@ -326,7 +596,7 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
         if hasattr(form_class, '_meta') and form_class._meta.exclude:
             exclude.extend(form_class._meta.exclude)
-        return modelform_factory(self.model, form=form_class, exclude=exclude, fields=fields)
+        return cached_modelform_factory(self.model, form=form_class, exclude=exclude, fields=fields)
 
     def get_form(self, request, fields=None, inst=None, data=None, initial={}):
         # When is send PUT (resource instance exists), it is possible send only changed values.
@@ -364,21 +634,59 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
         return False
 
-    def _get_instance(self, request, data):
+    def _get_instances(self, request, data_items):
+        """
+        Returns dict of existing objects of data items loaded with one query, keys are primary keys as text.
+        """
+        pks = [data['id'] for data in data_items if data.get('id') is not None]
+        if not pks:
+            return {}
+        try:
+            return dict((force_text(inst.pk), inst) for inst in self.get_queryset(request).filter(pk__in=pks))
+        except (ValueError, ValidationError):
+            # Not valid primary keys are reported per item
+            return None
+
+    def _get_instance(self, request, data, insts=None):
         # If data contains id this method is update otherwise create
         inst = None
         if 'id' in data.keys():
+            if insts is not None:
+                inst = insts.get(force_text(data.get('id')))
+                if inst is None:
+                    raise ResourceNotFoundException
+                return inst
+
             try:
-                inst = self.get_queryset(request).get(pk=data.get('id'))
+                inst = get_request_obj(request, self.get_queryset(request), data.get('id'))
             except ObjectDoesNotExist:
                 raise ResourceNotFoundException
         return inst
 
-    def _create_or_update(self, request, data):
+    def _can_bulk_create_model(self, inst):
         """
-        Helper for creating or updating resource
+        bulk_create skips save method and signals, it cannot create objects with parents (multi-table inheritance)
+        and sets primary keys only if the database returns them.
         """
-        inst = self._get_instance(request, data)
+        if (is_overridden(self.model, Model, 'save') or self.model._meta.parents or
+                pre_save.has_listeners(self.model) or post_save.has_listeners(self.model)):
+            return False
+        return inst.pk is not None or getattr(connections[self.model.objects.db].features,
+                                              'can_return_ids_from_bulk_insert', False)
+
+    def _can_bulk_create(self, form, data):
+        # Objects with many to many fields or reverse related objects need primary key before they are saved
+        if (self.core.has_save_model_hooks() or not self._can_bulk_create_model(form.instance) or
+                any(field.name in form.fields for field in self.model._meta.many_to_many)):
+            return False
+        return not any(isinstance(getattr(self.model, key, None), ForeignRelatedObjectsDescriptor) for key in data)
+
+    def _create_or_update(self, request, data, bulk_insts=None, insts=None):
+        """
+        Helper for creating or updating resource. If bulk_insts list is set, new objects that can be created
+        with bulk_create are appended into it instead of saving. insts is dict of already loaded objects.
+        """
+        inst = self._get_instance(request, data, insts)
 
         if inst and not self.has_update_permission(request, inst):
             return inst
@@ -403,6 +711,10 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
         inst = form.save(commit=False)
 
+        if bulk_insts is not None and not change and self._can_bulk_create(form, data):
+            bulk_insts.append(inst)
+            return inst
+
         # Core view can do modifications before save object
         self.core.pre_save_model(request, inst, form, change)
 
@@ -413,6 +725,7 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
         # Core view event after save object
         self.core.post_save_model(request, inst, form, change)
+        clear_permission_cache(request)
 
         postprocesor = DataPostprocessor(request, self.model, form_fields, inst)
         data = postprocesor.process_data(data)
@@ -420,19 +733,65 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
         return inst
 
     def _delete(self, request, inst):
+        # Primary key of deleted object is removed
+        remove_request_obj(request, inst)
         self.core.pre_delete_model(request, inst)
         self.core.delete_model(request, inst)
         self.core.post_delete_model(request, inst)
+        clear_permission_cache(request)
 
     @transaction.atomic
     def _atomic_create_or_update(self, request, data):
         inst = self._create_or_update(request, data)
         return inst
 
+    @transaction.atomic
+    def _atomic_bulk_create_or_update(self, request, data_items):
+        """
+        Creates or updates all objects in one transaction, errors of items contains _index of the item.
+        If any item is not valid, no object is saved.
+        """
+        insts = []
+        bulk_insts = []
+        errors = []
+        data_items = [isinstance(data, dict) and self.flatten_dict(data) or data for data in data_items]
+        # Existing objects are loaded with one query
+        existing_insts = self._get_instances(request, [data for data in data_items if isinstance(data, dict)])
+        for i, data in enumerate(data_items, 1):
+            try:
+                if not isinstance(data, dict):
+                    raise RestException(_('Item must be an object'))
+                insts.append(self._create_or_update(request, data, bulk_insts, existing_insts))
+            except (DataInvalidException, RestException) as ex:
+                er = ex.errors
+                er.update({'_index': i})
+                errors.append(er)
+
+        if errors:
+            # Rollback of the whole transaction
+            raise DataInvalidException(errors)
+
+        if bulk_insts:
+            self.model.objects.bulk_create(bulk_insts)
+            clear_permission_cache(request)
+        return insts
+
+    def bulk_create(self, request):
+        try:
+            insts = self._atomic_bulk_create_or_update(request, request.data)
+        except DataInvalidException as ex:
+            return HeadersResult({'errors': ex.errors}, status_code=400)
+        return HeadersResult(insts, status_code=201)
+
+    @instrumented_phase('handler')
     def create(self, request, pk=None, **kwargs):
         if not request.data:
             return rc.BAD_REQUEST
 
+        # JSON array creates or updates more objects at once
+        if isinstance(request.data, (list, tuple)):
+            return self.bulk_create(request)
+
         data = self.flatten_dict(request.data)
         try:
             inst = self._atomic_create_or_update(request, data)
@@ -444,6 +803,7 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
 
         return HeadersResult(inst, status_code=201)
 
+    @instrumented_phase('handler')
     def update(self, request, pk=None, **kwargs):
         if not request.data:
             return rc.BAD_REQUEST
@@ -457,11 +817,12 @@ class RestModelResource(RestResource, RestCoreResourceMixin, BaseModelResource):
         except ResourceNotFoundException:
             return rc.NOT_FOUND
 
+    @instrumented_phase('handler')
     def delete(self, request, pk, **kwargs):
         qs = self.get_queryset(request)
 
         try:
-            inst = qs.get(pk=pk)
+            inst = get_request_obj(request, qs, pk)
         except ObjectDoesNotExist:
             return rc.NOT_FOUND
         self._delete(request, inst)
@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import threading
+
 from django.conf import settings
 from django.conf.urls import patterns, url, include
 from django.utils.datastructures import SortedDict
@@ -10,6 +12,7 @@ from .utils import str_to_class
 from . import config
 from .loading import get_cores
 from .patterns import RestPattern
+from .resolvers import PrefixDispatchURLResolver
 from .auth_token.auth_resource import AuthResource
 
 
@@ -33,6 +36,35 @@ def get_model_core(model):
     return registered_model_cores.get(model_label)
 
 
+def get_model_rest_core(model):
+    """
+    Return core of given model that has URL of the REST resource or None
+    """
+    core = get_model_core(model)
+    if hasattr(core, 'get_api_url') and core.get_api_url_name():
+        return core
+    return None
+
+
+class LazyCoreURLConf(object):
+    """
+    URLconf of the core whose URL patterns are built with the first access (resolving or reversing URL).
+    """
+
+    def __init__(self, core):
+        self.core = core
+        self._urlpatterns = None
+        self._lock = threading.Lock()
+
+    @property
+    def urlpatterns(self):
+        if self._urlpatterns is None:
+            with self._lock:
+                if self._urlpatterns is None:
+                    self._urlpatterns = self.core.get_urls()
+        return self._urlpatterns
+
+
 class ISSite(object):
 
     def __init__(self, name='IS'):
@@ -64,11 +96,20 @@ class ISSite(object):
 
     def _set_items_urls(self, items, urlpatterns):
         for item in items:
-            urlpatterns += patterns('',
-                url(r'^%s' % (item.get_url_prefix()),
-                        include(item.get_urls())
-                    )
-            )
+            if config.LAZY_CORE_URLS:
+                if hasattr(item, 'rest_resource'):
+                    # REST resource is registered with its creation, serialization needs registered resources
+                    item.rest_resource
+                # include() is not used, it can access urlpatterns
+                urlpatterns += patterns('',
+                    url(r'^%s' % (item.get_url_prefix()), (LazyCoreURLConf(item), None, None))
+                )
+            else:
+                urlpatterns += patterns('',
+                    url(r'^%s' % (item.get_url_prefix()),
+                            include(item.get_urls())
+                        )
+                )
 
     def get_urls(self):
         LoginView = str_to_class(config.AUTH_LOGIN_VIEW)
@@ -87,7 +128,8 @@ class ISSite(object):
             urlpatterns += patterns('', pattern.get_url())
 
         self._set_items_urls(self._registry.values(), urlpatterns)
-        return urlpatterns
+        # Patterns are selected according to the first path segment
+        return [PrefixDispatchURLResolver(r'^', urlpatterns)]
 
 site = ISSite()
 
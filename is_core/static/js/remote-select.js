@@ -0,0 +1,144 @@
+/**
+ * Select boxes with data-resource attribute load their options from the REST resource. Options are searched with
+ * the filter key from data-search attribute, selected options rendered by the server are kept.
+ */
+(function (window, document) {
+	'use strict';
+
+	var PAGE_SIZE = 20,
+		SEARCH_DELAY = 300,
+		SELECTOR = 'select[data-resource]';
+
+	function getUrl(select, term) {
+		var url = select.getAttribute('data-resource'),
+			search = select.getAttribute('data-search');
+
+		if (search && term) {
+			url += (url.indexOf('?') === -1 ? '?' : '&') + encodeURIComponent(search) + '=' +
+				encodeURIComponent(term);
+		}
+		return url;
+	}
+
+	function setOptions(select, objs) {
+		var values = {}, i, option;
+
+		// Empty and selected options stay in the select
+		for (i = select.options.length - 1; i >= 0; i--) {
+			option = select.options[i];
+			if (option.value === '' || option.selected) {
+				values[option.value] = true;
+			} else {
+				select.remove(i);
+			}
+		}
+
+		for (i = 0; i < objs.length; i++) {
+			if (!values.hasOwnProperty(String(objs[i].id))) {
+				option = document.createElement('option');
+				option.value = objs[i].id;
+				option.text = objs[i]._obj_name;
+				select.appendChild(option);
+			}
+		}
+	}
+
+	function load(select, term) {
+		var xhr = new XMLHttpRequest();
+
+		select.remoteSelectRequest = xhr;
+		xhr.open('GET', getUrl(select, term), true);
+		xhr.setRequestHeader('Accept', 'application/json');
+		xhr.setRequestHeader('X-Fields', 'id,_obj_name');
+		xhr.setRequestHeader('X-Base', String(PAGE_SIZE));
+		xhr.setRequestHeader('X-Requested-With', 'XMLHttpRequest');
+		xhr.onreadystatechange = function () {
+			var objs;
+
+			// Responses of the older searches are ignored
+			if (xhr.readyState !== 4 || select.remoteSelectRequest !== xhr || xhr.status !== 200) {
+				return;
+			}
+			try {
+				objs = JSON.parse(xhr.responseText);
+			} catch (e) {
+				return;
+			}
+			if (objs instanceof Array) {
+				setOptions(select, objs);
+			}
+		};
+		xhr.send();
+	}
+
+	function init(select) {
+		var input, timeout = null, loaded = false;
+
+		if (select.remoteSelectInitialized) {
+			return;
+		}
+		select.remoteSelectInitialized = true;
+
+		if (select.getAttribute('data-search')) {
+			input = document.createElement('input');
+			input.type = 'search';
+			input.className = 'remote-select-search';
+			input.placeholder = select.getAttribute('data-placeholder') || select.getAttribute('placeholder') || '';
+			select.parentNode.insertBefore(input, select);
+			input.addEventListener('input', function () {
+				window.clearTimeout(timeout);
+				timeout = window.setTimeout(function () {
+					loaded = true;
+					load(select, input.value);
+				}, SEARCH_DELAY);
+			});
+		}
+
+		// The first page of options is loaded when the select is used for the first time
+		function loadFirstPage() {
+			if (!loaded) {
+				loaded = true;
+				load(select, input ? input.value : '');
+			}
+		}
+		select.addEventListener('focus', loadFirstPage);
+		select.addEventListener('mousedown', loadFirstPage);
+	}
+
+	function initAll(root) {
+		var selects, i;
+
+		if (root.nodeType !== 1 && root.nodeType !== 9) {
+			return;
+		}
+		if (root.matches && root.matches(SELECTOR)) {
+			init(root);
+		}
+		selects = root.querySelectorAll(SELECTOR);
+		for (i = 0; i < selects.length; i++) {
+			init(selects[i]);
+		}
+	}
+
+	function start() {
+		initAll(document);
+		// Snippets and inline pages are inserted into the page later
+		if (window.MutationObserver) {
+			new window.MutationObserver(function (mutations) {
+				var i, j;
+
+				for (i = 0; i < mutations.length; i++) {
+					for (j = 0; j < mutations[i].addedNodes.length; j++) {
+						initAll(mutations[i].addedNodes[j]);
+					}
+				}
+			}).observe(document.body, {childList: true, subtree: true});
+		}
+	}
+
+	if (document.readyState === 'loading') {
+		document.addEventListener('DOMContentLoaded', start);
+	} else {
+		start();
+	}
+}(window, document));
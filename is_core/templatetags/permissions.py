@@ -19,7 +19,6 @@ def get_obj(Model, pk):
     return Model.objects.get(pk=pk)
 
 
-# TODO: there is possibility cache permissions
 class PermissionNode(Node):
     def __init__(self, perm_name, vals, nodelist_true, nodelist_false):
         self.perm_name = perm_name
@@ -0,0 +1,183 @@
+from __future__ import unicode_literals
+
+import json
+import time
+
+from django.db import connection
+from django.forms.models import ModelChoiceField, ModelMultipleChoiceField
+from django.test.utils import CaptureQueriesContext
+
+from germanium.rest import RESTTestCase
+from germanium.anotations import login_all, data_provider
+
+from piston.utils import get_resource_of_model
+
+from is_core.tests.data_generator_test_case import DataGeneratorTestCase
+from is_core.tests.auth_test_cases import RestAuthMixin
+from is_core.tests.rest_generic_test_cases import RestResourcesMixin
+from is_core.version import get_version
+
+
+class Benchmark(object):
+    """
+    Measures requests per second and DB queries per request of the repeated request.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.duration = 0
+        self.queries = 0
+
+    def measure(self, func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as captured_queries:
+            start = time.time()
+            response = func(*args, **kwargs)
+            self.duration += time.time() - start
+        self.requests += 1
+        self.queries += len(captured_queries)
+        return response
+
+    def get_result(self):
+        return {
+            'requests': self.requests,
+            'requests_per_second': self.duration and self.requests / self.duration or None,
+            'queries_per_request': self.requests and float(self.queries) / self.requests or None,
+        }
+
+
+@login_all
+class RestBenchmark(RestResourcesMixin, RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
+    """
+    Benchmark of list reads with different page sizes, detail reads, creates (with nested related objects too),
+    updates and deletes of all registered REST resources with factory. Results are written to output_file as JSON.
+    """
+
+    iteration = 20
+    list_objects_count = 100
+    page_sizes = (10, 100)
+    output_file = 'rest_benchmark.json'
+
+    @classmethod
+    def setUpClass(cls):
+        super(RestBenchmark, cls).setUpClass()
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        super(RestBenchmark, cls).tearDownClass()
+        with open(cls.output_file, 'w') as f:
+            json.dump({'version': get_version(), 'database': connection.vendor, 'iteration': cls.iteration,
+                       'results': cls.results}, f, indent=4, sort_keys=True)
+
+    def add_result(self, resource_name, benchmark_name, benchmark):
+        self.results.setdefault(resource_name, {})[benchmark_name] = benchmark.get_result()
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_list_read(self, resource_name, resource, model):
+        list_url = resource.list_url()
+        if not resource.has_read_permission(self.get_request_with_user(self.r_factory.get(list_url))):
+            return
+
+        for i in range(self.list_objects_count):
+            self.new_instance(model)
+
+        for page_size in self.page_sizes:
+            benchmark = Benchmark()
+            self.default_headers['HTTP_X_BASE'] = str(page_size)
+            try:
+                for i in range(self.iteration):
+                    resp = benchmark.measure(self.get, list_url)
+                    self.assert_valid_JSON_response(resp, 'REST get list of model: %s\n response: %s' % (model, resp))
+            finally:
+                del self.default_headers['HTTP_X_BASE']
+            self.add_result(resource_name, 'list_read_%s' % page_size, benchmark)
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_detail_read(self, resource_name, resource, model):
+        inst = self.new_instance(model)
+        url = resource.url(inst.pk)
+        if not resource.has_read_permission(self.get_request_with_user(self.r_factory.get(url)), inst):
+            return
+
+        benchmark = Benchmark()
+        for i in range(self.iteration):
+            resp = benchmark.measure(self.get, url)
+            self.assert_valid_JSON_response(resp, 'REST get of model: %s\n response: %s' % (model, resp))
+        self.add_result(resource_name, 'detail_read', benchmark)
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_create(self, resource_name, resource, model):
+        list_url = resource.list_url()
+        request = self.get_request_with_user(self.r_factory.post(list_url))
+        if not resource.has_create_permission(request):
+            return
+
+        benchmark = Benchmark()
+        for i in range(self.iteration):
+            data, inst = self.get_serialized_data(request, resource)
+            resp = benchmark.measure(self.post, list_url, data=data)
+            self.assert_valid_JSON_created_response(resp, 'REST create of model: %s\n response: %s' % (model, resp))
+        self.add_result(resource_name, 'create', benchmark)
+
+    def get_nested_data(self, request, resource):
+        """
+        Data of the new object whose foreign keys are sent as nested objects, they are created with the object.
+        """
+        data, inst = self.get_data(request, resource)
+        nested_field_names = []
+        for field_name, field in resource().generate_form_class(request=request).base_fields.items():
+            if not isinstance(field, ModelChoiceField) or isinstance(field, ModelMultipleChoiceField):
+                continue
+
+            rel_resource = get_resource_of_model(field.queryset.model)
+            if (rel_resource and self.get_model_label(rel_resource.model) in self.factories and
+                    rel_resource.has_create_permission(request)):
+                data[field_name] = self.get_data(request, rel_resource)[0]
+                nested_field_names.append(field_name)
+        return data, nested_field_names
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_nested_create(self, resource_name, resource, model):
+        list_url = resource.list_url()
+        request = self.get_request_with_user(self.r_factory.post(list_url))
+        if not resource.has_create_permission(request):
+            return
+
+        benchmark = Benchmark()
+        for i in range(self.iteration):
+            data, nested_field_names = self.get_nested_data(request, resource)
+            if not nested_field_names:
+                return
+
+            resp = benchmark.measure(self.post, list_url, data=self.serialize(data))
+            self.assert_valid_JSON_created_response(resp, 'REST nested create of model: %s\n response: %s' %
+                                                    (model, resp))
+        self.add_result(resource_name, 'nested_create', benchmark)
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_update(self, resource_name, resource, model):
+        benchmark = Benchmark()
+        for i in range(self.iteration):
+            inst = self.new_instance(model)
+            url = resource.url(inst.pk)
+            request = self.get_request_with_user(self.r_factory.put(url))
+            if not resource.has_update_permission(request, inst):
+                return
+
+            data, data_inst = self.get_serialized_data(request, resource, True)
+            resp = benchmark.measure(self.put, url, data=data)
+            self.assert_valid_JSON_response(resp, 'REST update of model: %s\n response: %s' % (model, resp))
+        self.add_result(resource_name, 'update', benchmark)
+
+    @data_provider(RestResourcesMixin.get_rest_resources)
+    def test_delete(self, resource_name, resource, model):
+        benchmark = Benchmark()
+        for i in range(self.iteration):
+            inst = self.new_instance(model)
+            url = resource.url(inst.pk)
+            if not resource.has_delete_permission(self.get_request_with_user(self.r_factory.delete(url)), inst):
+                return
+
+            resp = benchmark.measure(self.delete, url)
+            self.assert_http_accepted(resp, 'REST delete of model: %s\n response: %s' % (model, resp))
+        self.add_result(resource_name, 'delete', benchmark)
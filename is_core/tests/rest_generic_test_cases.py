@@ -26,14 +26,11 @@ def add_urls_to_resource(resource):
     return resource
 
 
-@login_all
-class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
-
-    iteration = 10
+class RestResourcesMixin(object):
 
     @classmethod
     def setUpClass(cls):
-        super(TestRestsAvailability, cls).setUpClass()
+        super(RestResourcesMixin, cls).setUpClass()
         cls.rest_resources = cls.set_up_rest_resources()
 
     @classmethod
@@ -56,6 +53,10 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
         return self.rest_resources
 
     def get_serialized_data(self, request, resource, update=False):
+        data, inst = self.get_data(request, resource, update)
+        return self.serialize(data), inst
+
+    def get_data(self, request, resource, update=False):
         inst = self.new_instance(resource.model)
 
         form_class = resource().generate_form_class(request=request, inst=update and inst or None)
@@ -72,9 +73,15 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
         # Removed instance (must be created because FK)
         inst.delete()
 
-        return self.serialize(data), inst
+        return data, inst
+
+
+@login_all
+class TestRestsAvailability(RestResourcesMixin, RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
+
+    iteration = 10
 
-    @data_provider(get_rest_resources)
+    @data_provider(RestResourcesMixin.get_rest_resources)
     def test_should_return_data_from_resource_list(self, resource_name, resource, model):
         list_url = resource.list_url()
 
@@ -90,7 +97,7 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
                 self.assert_valid_JSON_response(resp, 'REST get list of model: %s\n response: %s' % (model, resp))
                 self.assertEqual(int(resp['X-Total']) - i, started_total_count + 1)
 
-    @data_provider(get_rest_resources)
+    @data_provider(RestResourcesMixin.get_rest_resources)
     def test_should_return_data_from_resource(self, resource_name, resource, model):
         for _ in range(self.iteration):
             inst = self.new_instance(model)
@@ -103,7 +110,7 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
             resp = self.get(url)
             self.assert_valid_JSON_response(resp, 'REST get of model: %s\n response: %s' % (model, resp))
 
-    @data_provider(get_rest_resources)
+    @data_provider(RestResourcesMixin.get_rest_resources)
     def test_should_delete_data_from_resource(self, resource_name, resource, model):
         for i in range(self.iteration):
             inst = self.new_instance(model)
@@ -119,7 +126,7 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
             self.assert_http_not_found(self.get(url), 'REST get (should not found) of model: %s\n response: %s' %
                                        (model, resp))
 
-    @data_provider(get_rest_resources)
+    @data_provider(RestResourcesMixin.get_rest_resources)
     def test_should_create_data_of_resource(self, resource_name, resource, model):
         for _ in range(self.iteration):
             list_url = resource.list_url()
@@ -138,7 +145,7 @@ class TestRestsAvailability(RestAuthMixin, DataGeneratorTestCase, RESTTestCase):
             self.assert_valid_JSON_created_response(resp, 'REST create of model: %s\n response: %s' % (model, resp))
             self.assertEqual(count_before + 1, count_after)
 
-    @data_provider(get_rest_resources)
+    @data_provider(RestResourcesMixin.get_rest_resources)
     def test_should_update_data_of_resource(self, resource_name, resource, model):
         for _ in range(self.iteration):
             inst_from = self.new_instance(model)
@@ -34,6 +34,16 @@ def get_new_class_name(prefix, klass):
     return prefix + klass.__name__
 
 
+def is_overridden(obj, klass, method_name):
+    """
+    Returns True if method of the obj (instance or class) is not the one defined in klass.
+    """
+    obj_class = isinstance(obj, type) and obj or obj.__class__
+    obj_method = getattr(obj_class, method_name)
+    klass_method = getattr(klass, method_name)
+    return getattr(obj_method, '__func__', obj_method) is not getattr(klass_method, '__func__', klass_method)
+
+
 def flatten_fieldsets(fieldsets):
     """Returns a list of field names from an admin fieldsets structure."""
     field_names = []
@@ -46,6 +56,17 @@ def flatten_fieldsets(fieldsets):
     return field_names
 
 
+def flatten_fields_dict(fields_dict, prefix=''):
+    """Returns sorted list of field names from a nested fields dict, nested names are joined with __."""
+    field_names = []
+    for field_name, subfields_dict in sorted(fields_dict.items()):
+        if subfields_dict:
+            field_names.extend(flatten_fields_dict(subfields_dict, '%s%s__' % (prefix, field_name)))
+        else:
+            field_names.append(prefix + field_name)
+    return field_names
+
+
 class Enum(set):
     def __getattr__(self, name):
         if name in self:
@@ -1,6 +1,14 @@
 from __future__ import unicode_literals
 
 from django import forms
+from django.forms.models import modelform_factory
+
+
+# Generated model form classes, key is (model, form, fields, exclude, formfield_callback)
+form_classes = {}
+
+# Max number of cached form classes, REST resources generate form classes according to the request data
+MAX_FORM_CLASSES = 1000
 
 
 def formset_has_file_field(fromset):
@@ -8,3 +16,20 @@ def formset_has_file_field(fromset):
         if isinstance(field, forms.FileField):
             return True
     return False
+
+
+def cached_modelform_factory(model, form=forms.ModelForm, fields=None, exclude=None, formfield_callback=None):
+    """
+    Returns model form class generated with modelform_factory. Form class is generated only once for every
+    combination of input parameters. formfield_callback must not depend on the request.
+    """
+    key = (model, form, fields is not None and tuple(fields) or None,
+           exclude is not None and tuple(sorted(set(exclude))) or None, formfield_callback)
+    try:
+        return form_classes[key]
+    except KeyError:
+        form_class = modelform_factory(model, form=form, fields=fields, exclude=exclude,
+                                       formfield_callback=formfield_callback)
+        if len(form_classes) < MAX_FORM_CLASSES:
+            form_classes[key] = form_class
+        return form_class
@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
+from django.db.models.sql.datastructures import EmptyResultSet
 from django.shortcuts import _get_queryset
+from django.utils.encoding import force_text
 
 
 def get_object_or_none(klass, *args, **kwargs):
@@ -11,6 +13,44 @@ def get_object_or_none(klass, *args, **kwargs):
         return None
 
 
+def _get_identity_map(request):
+    if not hasattr(request, '_identity_map'):
+        request._identity_map = {}
+    return request._identity_map
+
+
+def _get_queryset_fingerprint(queryset):
+    sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    return '%s:%s%r' % (queryset.db, sql, params)
+
+
+def get_request_obj(request, queryset, pk):
+    """
+    Returns object with pk from the queryset. Object is loaded only once during request, next calls with the same
+    queryset (the same SQL) and pk return the same instance. Raises DoesNotExist if the queryset does not contain
+    the object.
+    """
+    try:
+        fingerprint = _get_queryset_fingerprint(queryset)
+    except EmptyResultSet:
+        raise queryset.model.DoesNotExist
+
+    queryset_objs = _get_identity_map(request).setdefault((queryset.model, force_text(pk)), {})
+    if fingerprint not in queryset_objs:
+        queryset_objs[fingerprint] = queryset.get(pk=pk)
+    return queryset_objs[fingerprint]
+
+
+def remove_request_obj(request, obj):
+    _get_identity_map(request).pop((obj.__class__, force_text(obj.pk)), None)
+
+
+def remove_request_model_objs(request, model):
+    identity_map = _get_identity_map(request)
+    for key in [key for key in identity_map if key[0] is model]:
+        del identity_map[key]
+
+
 def get_model_field_names(model):
     return [model_field.name for model_field in model._meta.fields] + ['pk']
 